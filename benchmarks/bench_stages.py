@@ -0,0 +1,145 @@
+"""
+Throughput and peak memory of every analysis stage, over corpus sizes from a sentence to a
+book, built from the bundled Latin sample. Run from the repository root:
+
+    python -m benchmarks.bench_stages --sizes sentence book --output results.json
+
+Results are written as JSON (to stdout by default) and summarized as a table on stderr.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from loquax import Document
+from loquax.abstractions import Language
+from loquax.abstractions.phonology import get_phonemes
+from loquax.abstractions.syllabification import get_syllables_from_phonemes, syllabify
+from loquax.languages import Latin
+
+CORPUS = Path(__file__).parent / "corpus" / "latin_sample.txt"
+
+# Corpus sizes, in tokens
+SIZES = {
+    "sentence": 10,
+    "paragraph": 100,
+    "chapter": 1_000,
+    "book": 10_000,
+    "corpus": 100_000,
+}
+
+
+def make_text(tokens: int) -> str:
+    """
+    Build a text of exactly `tokens` words by cycling through the sample corpus.
+    """
+    words = CORPUS.read_text(encoding="utf-8").split()
+    return " ".join(words[i % len(words)] for i in range(tokens))
+
+
+def stage_runners(text: str, lang: Language) -> Dict[str, Callable[[], object]]:
+    """
+    Prepare the input of every stage up front, so each runner only times its own stage.
+    """
+    tokens = lang.tokenizer.tokenize(text)
+    phonemes = [get_phonemes(token, lang) for token in tokens]
+    syllables = [syllabify(token, lang) for token in phonemes]
+    return {
+        "LatinTokenizer.tokenize": lambda: lang.tokenizer.tokenize(text),
+        "get_phonemes": lambda: [get_phonemes(token, lang) for token in tokens],
+        "get_syllables_from_phonemes": lambda: [
+            get_syllables_from_phonemes(token, lang) for token in phonemes
+        ],
+        "MorphismStore.apply_all": lambda: [
+            lang.syllable_morphisms.apply_all(token) for token in syllables
+        ],
+        "Document.to_string": lambda: Document(text, lang).to_string(
+            ipa=True, scansion=True
+        ),
+    }
+
+
+def measure(
+    run: Callable[[], object], lang: Language, repeat: int
+) -> Tuple[float, int]:
+    """
+    Return the best wall time over `repeat` runs, and the peak traced memory of one more
+    run. The analysis cache is cleared before every run so each starts cold.
+    """
+    timings = []
+    for _ in range(repeat):
+        lang.analysis_cache.clear()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    lang.analysis_cache.clear()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+
+def run_benchmarks(sizes: List[str], repeat: int, lang: Language = Latin) -> List[dict]:
+    results = []
+    for size in sizes:
+        tokens = SIZES[size]
+        for stage, run in stage_runners(make_text(tokens), lang).items():
+            seconds, peak = measure(run, lang, repeat)
+            results.append(
+                {
+                    "stage": stage,
+                    "size": size,
+                    "tokens": tokens,
+                    "seconds": seconds,
+                    "tokens_per_second": tokens / seconds if seconds else None,
+                    "peak_bytes": peak,
+                }
+            )
+    return results
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=list(SIZES),
+        default=["sentence", "paragraph", "chapter", "book"],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=argparse.FileType("w"), default=sys.stdout)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.repeat)
+    json.dump(
+        {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "results": results,
+        },
+        args.output,
+        indent=2,
+    )
+    args.output.write("\n")
+
+    for result in results:
+        rate = result["tokens_per_second"]
+        print(
+            f"{result['stage']:<30} {result['size']:<10} "
+            f"{'n/a' if rate is None else format(rate, ',.0f'):>14} tok/s "
+            f"{result['peak_bytes'] / 1024:>12,.1f} KiB",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
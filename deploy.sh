@@ -24,7 +24,7 @@ install_bumpversion() {
 }
 
 bump_version() {
-    bumpversion --current-version $1 $2 setup.py
+    bumpversion --current-version $1 $2 loquax/__init__.py
 }
 
 install_twine() {
@@ -1 +1,11 @@
-from loquax.text_processing import Document
+__version__ = "0.2.0"
+
+
+def __getattr__(name: str):
+    # Imported on first use, so that importing a submodule (e.g. loquax.languages in a
+    # short-lived worker) does not load the text processing modules
+    if name == "Document":
+        from loquax.text_processing import Document
+
+        return Document
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,7 @@ from .linguistic_entities import (
     Phoneme,
     Syllable,
     Tokenizer,
+    TokenSpan,
     PhonemeSyllabificationRuleStore,
     MorphismStore,
     Morphism,
@@ -10,3 +11,5 @@ from .linguistic_entities import (
     Rule,
     Constants,
 )
+from .cache import LRUCache, CacheInfo
+from .pipeline import Pipeline, Stage, TokenAnalysis
@@ -0,0 +1,205 @@
+from array import array
+from dataclasses import dataclass, field
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from loquax.abstractions import Language, Phoneme, Syllable
+from loquax.abstractions.constants import VOWEL
+from loquax.abstractions.phonology import get_phonemes
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class PhonemeCodec:
+    """
+    Numbers the interned phonemes of a language, so a sequence of phonemes can be stored
+    as one small integer per phoneme. `features[i]` is the feature bitmask of phoneme `i`.
+    """
+
+    def __init__(self, lang: Language):
+        self.lang = lang
+        self.phonemes: Tuple[Phoneme, ...] = tuple(
+            phoneme
+            for (_, ipa), phoneme in lang.phoneme_inventory.items()
+            if ipa is not None
+        )
+        self.ids: Dict[Tuple[str, str], int] = {
+            (phoneme.val, phoneme.ipa): i for i, phoneme in enumerate(self.phonemes)
+        }
+        self.features = bytes(phoneme.features for phoneme in self.phonemes)
+        self.typecode = "B" if len(self.phonemes) <= 0xFF else "H"
+        self._splits: Dict[bytes, Tuple[int, int]] = {}
+
+    def encode(self, phonemes: Iterable[Phoneme]) -> List[int]:
+        ids = self.ids
+        return [ids[(phoneme.val, phoneme.ipa)] for phoneme in phonemes]
+
+    def decode(self, ids: Iterable[int]) -> List[Phoneme]:
+        phonemes = self.phonemes
+        return [phonemes[i] for i in ids]
+
+    def split(self, cluster: array) -> Tuple[int, int]:
+        """
+        The lengths of the (coda, onset) the syllabification rules divide a consonant
+        cluster into, memoized per distinct cluster.
+        """
+        key = cluster.tobytes()
+        split = self._splits.get(key)
+        if split is None:
+            coda, onset = self.lang.syllabification_rules.apply_all(
+                self.decode(cluster)
+            )
+            split = self._splits[key] = (len(coda), len(onset))
+        return split
+
+
+def _syllabify_array(
+    ids: array, token_offsets: array, codec: PhonemeCodec
+) -> Tuple[array, array, array]:
+    vowel_flags = bytes(feature & VOWEL for feature in codec.features)
+    vowels = array("I", compress(range(len(ids)), map(vowel_flags.__getitem__, ids)))
+
+    starts, ends, offsets = array("I"), array("I"), array("I", [0])
+    v = 0
+    for t in range(len(token_offsets) - 1):
+        token_start, token_end = token_offsets[t], token_offsets[t + 1]
+        first = v
+        while v < len(vowels) and vowels[v] < token_end:
+            v += 1
+
+        starts.append(token_start)
+        for j in range(first, v - 1):
+            coda, onset = codec.split(ids[vowels[j] + 1 : vowels[j + 1]])
+            ends.append(vowels[j] + 1 + coda)
+            starts.append(vowels[j + 1] - onset)
+        ends.append(token_end)
+        offsets.append(len(starts))
+    return starts, ends, offsets
+
+
+def _syllabify_numpy(
+    ids: array, token_offsets: array, codec: PhonemeCodec
+) -> Tuple[array, array, array]:
+    phoneme_ids = np.frombuffer(ids, dtype=np.dtype(ids.typecode))
+    offsets = np.frombuffer(token_offsets, dtype=np.uint32).astype(np.int64)
+    features = np.frombuffer(codec.features, dtype=np.uint8)
+
+    # Every vowel, and the token it belongs to
+    vowels = np.flatnonzero(features[phoneme_ids] & VOWEL)
+    vowel_tokens = np.searchsorted(offsets, vowels, side="right") - 1
+    is_first = np.ones(len(vowels), dtype=bool)
+    is_first[1:] = vowel_tokens[1:] != vowel_tokens[:-1]
+    is_last = np.ones(len(vowels), dtype=bool)
+    is_last[:-1] = is_first[1:]
+
+    # Only the clusters between two vowels of one token go through the rules
+    codas = np.zeros(len(vowels), dtype=np.int64)
+    onsets = np.zeros(len(vowels), dtype=np.int64)
+    for j in np.flatnonzero(~is_last).tolist():
+        codas[j], onsets[j + 1] = codec.split(ids[vowels[j] + 1 : vowels[j + 1]])
+
+    # One syllable per vowel, and one spanning each token without vowels
+    counts = np.maximum(np.bincount(vowel_tokens, minlength=len(offsets) - 1), 1)
+    syllable_offsets = np.zeros(len(offsets), dtype=np.int64)
+    np.cumsum(counts, out=syllable_offsets[1:])
+    starts = offsets[:-1].repeat(counts)
+    ends = offsets[1:].repeat(counts)
+
+    ranks = np.arange(len(vowels)) - np.searchsorted(vowels, offsets[:-1])[vowel_tokens]
+    slots = syllable_offsets[vowel_tokens] + ranks
+    starts[slots] = np.where(is_first, offsets[vowel_tokens], vowels - onsets)
+    ends[slots] = np.where(is_last, offsets[vowel_tokens + 1], vowels + 1 + codas)
+
+    return (
+        array("I", starts.astype(np.uint32).tobytes()),
+        array("I", ends.astype(np.uint32).tobytes()),
+        array("I", syllable_offsets.astype(np.uint32).tobytes()),
+    )
+
+
+def syllabify_columnar(
+    ids: array, token_offsets: array, codec: PhonemeCodec
+) -> Tuple[array, array, array]:
+    """
+    Syllabify a whole encoded corpus at once, with the same boundaries as `syllabify`.
+    Returns the (start, end) phoneme positions of every syllable, and the offsets of the
+    syllables of each token in them. Uses NumPy when it is installed.
+    """
+    if np is not None:
+        return _syllabify_numpy(ids, token_offsets, codec)
+    return _syllabify_array(ids, token_offsets, codec)
+
+
+@dataclass
+class ColumnarCorpus:
+    """
+    A corpus of analyzed tokens stored as flat integer arrays instead of Phoneme and
+    Syllable objects: the phoneme IDs of all tokens back to back, where each token starts
+    (`token_offsets`), and the phoneme span of every syllable. Syllables are rebuilt,
+    with the syllable morphisms of the language applied, only when asked for:
+
+        corpus = ColumnarCorpus.encode(Latin.tokenizer.tokenize(text), Latin)
+        corpus.syllables(0) == get_syllables_from_token(tokens[0], Latin)
+    """
+
+    language: Language
+    codec: PhonemeCodec = field(repr=False)
+    phoneme_ids: array = field(repr=False)
+    token_offsets: array = field(repr=False)
+    syllable_starts: array = field(repr=False)
+    syllable_ends: array = field(repr=False)
+    syllable_offsets: array = field(repr=False)
+
+    @classmethod
+    def encode(cls, tokens: Iterable[str], lang: Language) -> "ColumnarCorpus":
+        codec = PhonemeCodec(lang)
+        ids = array(codec.typecode)
+        token_offsets = array("I", [0])
+        encoded: Dict[str, List[int]] = {}
+        for token in tokens:
+            token_ids = encoded.get(token)
+            if token_ids is None:
+                phonemes = lang.phoneme_morphisms.apply_all(get_phonemes(token, lang))
+                token_ids = encoded[token] = codec.encode(phonemes)
+            ids.extend(token_ids)
+            token_offsets.append(len(ids))
+
+        starts, ends, offsets = syllabify_columnar(ids, token_offsets, codec)
+        return cls(lang, codec, ids, token_offsets, starts, ends, offsets)
+
+    def __len__(self) -> int:
+        return len(self.token_offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the arrays holding the corpus.
+        """
+        arrays = (
+            self.phoneme_ids,
+            self.token_offsets,
+            self.syllable_starts,
+            self.syllable_ends,
+            self.syllable_offsets,
+        )
+        return sum(len(a) * a.itemsize for a in arrays)
+
+    def phonemes(self, index: int) -> List[Phoneme]:
+        start, end = self.token_offsets[index], self.token_offsets[index + 1]
+        return self.codec.decode(self.phoneme_ids[start:end])
+
+    def syllables(self, index: int) -> List[Syllable]:
+        lang, decode, ids = self.language, self.codec.decode, self.phoneme_ids
+        syllables = [
+            Syllable(decode(ids[self.syllable_starts[s] : self.syllable_ends[s]]), lang)
+            for s in range(
+                self.syllable_offsets[index], self.syllable_offsets[index + 1]
+            )
+        ]
+        return lang.syllable_morphisms.apply_all(syllables)
+
+    def iter_syllables(self) -> Iterator[List[Syllable]]:
+        return (self.syllables(i) for i in range(len(self)))
@@ -1,10 +1,57 @@
+import unicodedata
 from dataclasses import dataclass
+from functools import cached_property
 from itertools import chain
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Set
+
+from loquax.abstractions.trie import SymbolTrie
+
+# Feature bits stored in `Constants.features`, one per phonological class
+VOWEL = 1 << 0
+CONSONANT = 1 << 1
+STOP = 1 << 2
+LIQUID = 1 << 3
+ASPIRATE = 1 << 4
+DIPHTHONG = 1 << 5
+
+# Diacritic bits stored in `Constants.diacritics`, one per accent
+MACRON = 1 << 0
+TREMA = 1 << 1
+ACUTE = 1 << 2
+GRAVE = 1 << 3
+TILDE = 1 << 4
+
+_DIACRITIC_NAMES = (
+    (MACRON, "MACRON"),
+    (TREMA, "DIAERESIS"),
+    (ACUTE, "ACUTE"),
+    (GRAVE, "GRAVE"),
+    (TILDE, "TILDE"),
+)
+
+
+def diacritic_flags(symbol: str) -> int:
+    """
+    The bitmask of the accents carried by any character of `symbol`, read from the
+    Unicode character names (e.g. LATIN SMALL LETTER A WITH MACRON).
+    """
+    flags = 0
+    for char in symbol:
+        name = unicodedata.name(char, "")
+        for bit, accent in _DIACRITIC_NAMES:
+            if accent in name:
+                flags |= bit
+    return flags
 
 
 @dataclass
 class Constants:
+    """
+    The symbol inventory of a language. The derived sets and the per-symbol feature
+    and diacritic tables are compiled on first access and cached, so the fields should be treated
+    as read-only once the constants are in use.
+    """
+
     vowel_equivalencies: Dict[str, List[str]]
     consonant_equivalencies: Dict[str, List[str]]
     aspirates: Set[str]
@@ -24,31 +71,61 @@ class Constants:
             chain(d.keys(), *(v if isinstance(v, list) else [v] for v in d.values()))
         )
 
-    @property
+    @cached_property
     def equivalencies(self) -> Dict[str, List[str]]:
         return self.vowel_equivalencies | self.consonant_equivalencies
 
-    @property
-    def vowels(self) -> Set[str]:
-        return set(self.get_distinct_elements(self.vowel_equivalencies))
+    @cached_property
+    def vowels(self) -> FrozenSet[str]:
+        return frozenset(self.get_distinct_elements(self.vowel_equivalencies))
 
-    @property
-    def consonants(self) -> Set[str]:
-        return set(self.get_distinct_elements(self.consonant_equivalencies))
+    @cached_property
+    def consonants(self) -> FrozenSet[str]:
+        return frozenset(self.get_distinct_elements(self.consonant_equivalencies))
 
-    @property
-    def symbol_groups(self) -> Set[str]:
-        return set(
+    @cached_property
+    def symbol_groups(self) -> FrozenSet[str]:
+        return frozenset(
             filter(
                 lambda x: len(x) > 1,
-                set(
-                    self.aspirates.union(
-                        self.diphthongs,
-                        self.liquid_letters,
-                        self.stop_letters,
-                        self.vowels,
-                        self.consonants,
-                    )
+                self.aspirates.union(
+                    self.diphthongs,
+                    self.liquid_letters,
+                    self.stop_letters,
+                    self.vowels,
+                    self.consonants,
                 ),
             )
         )
+
+    @cached_property
+    def symbol_trie(self) -> SymbolTrie:
+        return SymbolTrie(self.symbol_groups)
+
+    @cached_property
+    def features(self) -> Dict[str, int]:
+        """
+        Map every known symbol to the bitmask of the feature classes it belongs to,
+        e.g. `features["ph"] & ASPIRATE`. Symbols absent from the table have no features.
+        """
+        feature_sets = (
+            (VOWEL, self.vowels),
+            (CONSONANT, self.consonants),
+            (STOP, self.stop_letters),
+            (LIQUID, self.liquid_letters),
+            (ASPIRATE, self.aspirates),
+            (DIPHTHONG, self.diphthongs),
+        )
+        features: Dict[str, int] = {}
+        for bit, symbols in feature_sets:
+            for symbol in symbols:
+                features[symbol] = features.get(symbol, 0) | bit
+        return features
+
+    @cached_property
+    def diacritics(self) -> Dict[str, int]:
+        """
+        Map every known symbol to the bitmask of its accents, e.g. `diacritics["ā"] & MACRON`.
+        """
+        symbols = self.features.keys() | self.equivalencies.keys()
+        return {symbol: diacritic_flags(symbol) for symbol in symbols}
@@ -0,0 +1,91 @@
+from dataclasses import fields, is_dataclass
+from types import CodeType, FunctionType, MethodType
+from typing import Any, Set
+
+
+def fingerprint(*objects: Any) -> str:
+    """
+    A SHA-256 digest of the structure of `objects`, stable across runs and processes:
+    dataclasses by their compared fields, containers by their contents, and functions by
+    their bytecode, constants, defaults, closures, and the code of the global functions
+    they call. Changing a rule, a morphism or a constant of a language changes the
+    fingerprint of that language.
+    """
+    # Imported on first use: loading OpenSSL is slow, and most processes never need it
+    import hashlib
+
+    digest = hashlib.sha256()
+    for obj in objects:
+        _feed(digest, obj, set())
+    return digest.hexdigest()
+
+
+def _feed(digest, obj: Any, seen: Set[int]):
+    update = digest.update
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        update(f"{type(obj).__name__}:{obj!r};".encode("utf-8"))
+        return
+
+    # Objects already being fed (e.g. a language reached again through one of its
+    # phonemes) are referred to by their type only, which also ends reference cycles
+    if id(obj) in seen:
+        update(f"<{type(obj).__qualname__}>;".encode("utf-8"))
+        return
+    seen.add(id(obj))
+
+    if isinstance(obj, (list, tuple)):
+        update(f"{type(obj).__name__}[".encode("utf-8"))
+        for item in obj:
+            _feed(digest, item, seen)
+        update(b"]")
+    elif isinstance(obj, (set, frozenset)):
+        update(b"set[")
+        for item in sorted(obj, key=repr):
+            _feed(digest, item, seen)
+        update(b"]")
+    elif isinstance(obj, dict):
+        update(b"dict[")
+        for key in sorted(obj, key=repr):
+            _feed(digest, key, seen)
+            _feed(digest, obj[key], seen)
+        update(b"]")
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        update(f"{type(obj).__qualname__}(".encode("utf-8"))
+        for f in fields(obj):
+            if f.compare:
+                update(f"{f.name}=".encode("utf-8"))
+                _feed(digest, getattr(obj, f.name), seen)
+        update(b")")
+    elif isinstance(obj, MethodType):
+        _feed(digest, obj.__func__, seen)
+    elif isinstance(obj, FunctionType):
+        update(b"function(")
+        _feed(digest, obj.__code__, seen)
+        _feed(digest, obj.__defaults__, seen)
+        _feed(digest, obj.__kwdefaults__, seen)
+        if obj.__closure__:
+            for cell in obj.__closure__:
+                _feed(digest, cell.cell_contents, seen)
+        for name in sorted(_global_names(obj.__code__)):
+            value = obj.__globals__.get(name)
+            if isinstance(value, (FunctionType, bool, int, float, str, bytes)):
+                update(f"{name}=".encode("utf-8"))
+                _feed(digest, value, seen)
+        update(b")")
+    elif isinstance(obj, CodeType):
+        update(b"code(")
+        update(obj.co_code)
+        _feed(digest, obj.co_names, seen)
+        for const in obj.co_consts:
+            _feed(digest, const, seen)
+        update(b")")
+    else:
+        update(f"<{type(obj).__module__}.{type(obj).__qualname__}>;".encode("utf-8"))
+
+
+def _global_names(code: CodeType) -> Set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _global_names(const)
+    return names
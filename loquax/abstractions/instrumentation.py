@@ -0,0 +1,155 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# The Stats currently recording, if any. Instrumented code reads it once per call and
+# skips all bookkeeping when it is None, so disabled instrumentation costs a lookup.
+_active: Optional["Stats"] = None
+
+
+@dataclass
+class StageStats:
+    """
+    Call count and cumulative wall time of a pipeline stage.
+    """
+
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class MorphismStats:
+    """
+    How often a morphism of a store was evaluated and fired, and the time spent on it.
+    """
+
+    store: Any
+    morphism: Any
+    index: int
+    evaluations: int = 0
+    hits: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class RuleSequenceStats:
+    """
+    How often a rule sequence of a syllabification rule store was the one that matched.
+    """
+
+    store: Any
+    rule_sequence: Any
+    index: int
+    fired: int = 0
+
+
+@dataclass
+class Stats:
+    """
+    Counters recorded while instrumentation is enabled, see `profile`.
+    """
+
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    morphisms: Dict[Tuple[int, int], MorphismStats] = field(default_factory=dict)
+    rule_sequences: Dict[Tuple[int, int], RuleSequenceStats] = field(
+        default_factory=dict
+    )
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def record_stage(self, name: str, seconds: float):
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats(name)
+            stats.calls += 1
+            stats.seconds += seconds
+
+    def record_morphism(
+        self, store: Any, index: int, evaluations: int, hits: int, seconds: float
+    ):
+        with self._lock:
+            key = (id(store), index)
+            stats = self.morphisms.get(key)
+            if stats is None:
+                stats = self.morphisms[key] = MorphismStats(
+                    store, store.morphisms[index], index
+                )
+            stats.evaluations += evaluations
+            stats.hits += hits
+            stats.seconds += seconds
+
+    def record_rule_sequence(self, store: Any, index: int):
+        with self._lock:
+            key = (id(store), index)
+            stats = self.rule_sequences.get(key)
+            if stats is None:
+                stats = self.rule_sequences[key] = RuleSequenceStats(
+                    store, store.rules[index], index
+                )
+            stats.fired += 1
+
+    def summary(self) -> List[str]:
+        """
+        Render the counters as human-readable lines, slowest entries first.
+        """
+        lines = [
+            f"stage {s.name}: {s.calls} calls, {s.seconds * 1000:.2f} ms"
+            for s in sorted(self.stages.values(), key=lambda s: -s.seconds)
+        ]
+        lines += [
+            f"morphism #{m.index}: {m.hits}/{m.evaluations} hits, {m.seconds * 1000:.2f} ms"
+            for m in sorted(self.morphisms.values(), key=lambda m: -m.seconds)
+        ]
+        lines += [
+            f"rule sequence #{r.index}: fired {r.fired} times"
+            for r in sorted(self.rule_sequences.values(), key=lambda r: -r.fired)
+        ]
+        return lines
+
+
+def active() -> Optional[Stats]:
+    """
+    The Stats currently recording, or None when instrumentation is disabled.
+    """
+    return _active
+
+
+def enable(stats: Optional[Stats] = None) -> Stats:
+    """
+    Start recording into `stats` (or a fresh Stats) until `disable` is called.
+    """
+    global _active
+    _active = stats if stats is not None else Stats()
+    return _active
+
+
+def disable() -> Optional[Stats]:
+    """
+    Stop recording and return the Stats that were being recorded into.
+    """
+    global _active
+    stats, _active = _active, None
+    return stats
+
+
+@contextmanager
+def profile(stats: Optional[Stats] = None) -> Iterator[Stats]:
+    """
+    Record per-stage, per-morphism and per-rule counters for the duration of the block:
+
+        with profile() as stats:
+            Document(text, Latin).to_string()
+        print("\\n".join(stats.summary()))
+
+    Recording is process-wide, so analyses running concurrently in other threads are
+    counted too. Analyses served from a cache do not reach the stages.
+    """
+    global _active
+    previous = _active
+    _active = stats if stats is not None else Stats()
+    try:
+        yield _active
+    finally:
+        _active = previous
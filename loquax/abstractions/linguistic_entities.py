@@ -1,13 +1,51 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, replace
-from functools import reduce
-from typing import Optional, List, Callable, Tuple, TypeVar, Generic, Union
-from loquax.abstractions.constants import Constants
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cached_property
+from time import perf_counter
+from typing import (
+    AbstractSet,
+    Optional,
+    List,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Generic,
+    Union,
+)
+import loquax
+from loquax.abstractions import instrumentation
+from loquax.abstractions.cache import LRUCache
+from loquax.abstractions.fingerprint import fingerprint
+from loquax.abstractions.constants import (
+    Constants,
+    VOWEL,
+    CONSONANT,
+    STOP,
+    LIQUID,
+    ASPIRATE,
+    DIPHTHONG,
+)
 
 # This can be any type that the Rule is supposed to operate on, e.g., Syllable or Phoneme
 T = TypeVar("T")
 
 
+@dataclass(frozen=True, slots=True)
+class TokenSpan:
+    """
+    A normalized token and the [start, end) offsets of the source text it was read from.
+    """
+
+    token: str
+    start: int
+    end: int
+
+
 class Tokenizer(ABC):
     """
     Abstract base class for a tokenizer.
@@ -17,29 +55,98 @@ class Tokenizer(ABC):
     def tokenize(self, text: str) -> List[str]:
         pass
 
+    def tokenize_spans(self, text: str) -> Iterator[TokenSpan]:
+        """
+        Tokenize `text`, keeping the offsets of every token in it. By default each token
+        of `tokenize` is searched for in the text (or in its lowercased form, for
+        tokenizers that lowercase) after the end of the previous one; tokenizers that
+        rewrite tokens further should override this.
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            lowered = text
+        offset = 0
+        for token in self.tokenize(text):
+            found = (text.find(token, offset), lowered.find(token, offset))
+            starts = [start for start in found if start >= 0]
+            if not starts:
+                raise ValueError(
+                    f"{type(self).__name__} produced the token '{token}', which is not "
+                    f"in the text after offset {offset}; it should implement "
+                    "tokenize_spans."
+                )
+            start = min(starts)
+            offset = start + len(token)
+            yield TokenSpan(token, start, offset)
+
+    def tokenize_stream_spans(self, chunks: Iterable[str]) -> Iterator[TokenSpan]:
+        """
+        Like `tokenize_stream`, with offsets into the concatenation of the chunks.
+        """
+        pending, consumed = "", 0
+        for chunk in chunks:
+            text = pending + chunk
+            cut = len(text)
+            while cut and not text[cut - 1].isspace():
+                cut -= 1
+            pending = text[cut:]
+            if cut:
+                for span in self.tokenize_spans(text[:cut]):
+                    yield TokenSpan(
+                        span.token, consumed + span.start, consumed + span.end
+                    )
+                consumed += cut
+        if pending:
+            for span in self.tokenize_spans(pending):
+                yield TokenSpan(span.token, consumed + span.start, consumed + span.end)
+
+    def tokenize_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Tokenize text arriving in chunks (e.g. the lines of a file). The trailing partial
+        word of each chunk is held back until the next whitespace, so tokens split across
+        chunk boundaries come out whole.
+        """
+        return (span.token for span in self.tokenize_stream_spans(chunks))
+
+
+def _always(unit) -> bool:
+    return True
+
+
+def _value_of(unit) -> str:
+    # Phonemes and syllables are represented by their val, which skips a __repr__ call
+    return unit.val if type(unit) in _REPR_IS_VAL else unit.__repr__()
+
 
 @dataclass
 class Rule(Generic[T]):
     """
     Represents a single rule that can be used to check if a given unit (e.g. syllable, phoneme)
-    matches certain criteria. The rule can be defined using a check function, a specific value,
-    or by being a wildcard.
+    matches certain criteria. The rule can be defined using a check function, a specific value
+    (or a set of values), or by being a wildcard.
+    The rule is compiled once into `predicate`, so its fields should not be changed afterwards.
     """
 
     check_fn: Optional[Callable[[T], bool]] = None
-    val: Optional[str] = None
+    val: Optional[Union[str, AbstractSet[str]]] = None
     wildcard: bool = False
+    predicate: Callable[[T], bool] = field(init=False, repr=False, compare=False)
 
-    def matches(self, unit: T) -> bool:
+    def __post_init__(self):
         if self.wildcard:
-            return True
+            predicate = _always
+        elif isinstance(self.val, str):
+            val = self.val
+            predicate = lambda unit: _value_of(unit) == val
+        elif self.val is not None:
+            vals = frozenset(self.val)
+            predicate = lambda unit: _value_of(unit) in vals
+        else:
+            predicate = self.check_fn
+        self.predicate = predicate
 
-        match_predicate = (
-            lambda s: s.__repr__() == self.val
-            if self.val is not None
-            else self.check_fn(s)
-        )
-        return match_predicate(unit)
+    def matches(self, unit: T) -> bool:
+        return self.predicate(unit)
 
 
 @dataclass
@@ -47,17 +154,33 @@ class RuleSequence(Generic[T]):
     """
     Represents a sequence of rules that can be used to match against a sequence of units (e.g. syllables, phonemes).
     The sequence is matched when all individual rules in the sequence match their corresponding units.
+    Wildcard rules are compiled away, leaving the offsets and predicates of the others in `checks`.
     """
 
     rules: List[Rule[T]]
+    checks: Tuple[Tuple[int, Callable[[T], bool]], ...] = field(
+        init=False, repr=False, compare=False
+    )
 
-    def matches(self, units: List[T]) -> bool:
+    def __post_init__(self):
+        self.checks = tuple(
+            (offset, rule.predicate)
+            for offset, rule in enumerate(self.rules)
+            if not rule.wildcard
+        )
+
+    def matches(self, units: Sequence[T]) -> bool:
         if len(units) < len(self.rules):
             return False
+        return self.matches_at(units, len(units) - len(self.rules))
 
+    def matches_at(self, units: Sequence[T], start: int) -> bool:
+        """
+        Match the rules against `units[start : start + len(self.rules)]` without slicing.
+        The caller must make sure the window is within bounds.
+        """
         return all(
-            rule.matches(unit)
-            for rule, unit in zip(self.rules, units[-len(self.rules) :])
+            predicate(units[start + offset]) for offset, predicate in self.checks
         )
 
 
@@ -115,7 +238,84 @@ class MorphismStore(Generic[T]):
     morphisms: List[Morphism[T]]
 
     def apply_all(self, units: List[T]) -> List[T]:
-        return reduce(lambda units, morph: morph.apply(units), self.morphisms, units)
+        """
+        Apply every morphism in a single fused pass, with the same result as applying them
+        one after the other over whole lists. Morphism k runs behind morphism k-1 by its
+        suffix length, so the units it reads ahead have already been produced, and it keeps
+        the inputs it overwrote as its prefix window.
+        """
+        units = list(units)
+        length = len(units)
+        stages = []
+        lag = 0
+        for k, morph in enumerate(self.morphisms):
+            prefix = morph.prefix.rules if morph.prefix else []
+            suffix = morph.suffix.rules if morph.suffix else []
+            lag += len(suffix) if k else 0
+            transform = (
+                morph.transformation
+                if callable(morph.transformation)
+                else lambda _, unit=morph.transformation: unit
+            )
+            stages.append(
+                (
+                    k,
+                    lag,
+                    morph.target.predicate,
+                    len(prefix),
+                    morph.prefix.matches_at if morph.prefix and prefix else None,
+                    len(suffix),
+                    morph.suffix.matches_at if morph.suffix and suffix else None,
+                    transform,
+                    deque(maxlen=len(prefix)),
+                )
+            )
+
+        stats = instrumentation.active()
+        if stats is not None:
+            evaluations = [0] * len(stages)
+            hits = [0] * len(stages)
+            seconds = [0.0] * len(stages)
+
+        for position in range(length + lag):
+            for (
+                k,
+                offset,
+                target,
+                prefix_length,
+                prefix_matches,
+                suffix_length,
+                suffix_matches,
+                transform,
+                history,
+            ) in stages:
+                index = position - offset
+                if index < 0:
+                    break
+                if index >= length:
+                    continue
+                if stats is not None:
+                    started = perf_counter()
+                unit = units[index]
+                matched = (
+                    target(unit)
+                    and len(history) == prefix_length
+                    and index + suffix_length < length
+                    and (prefix_matches is None or prefix_matches(history, 0))
+                    and (suffix_matches is None or suffix_matches(units, index + 1))
+                )
+                if matched:
+                    units[index] = transform(unit)
+                history.append(unit)
+                if stats is not None:
+                    evaluations[k] += 1
+                    hits[k] += 1 if matched else 0
+                    seconds[k] += perf_counter() - started
+
+        if stats is not None:
+            for k in range(len(stages)):
+                stats.record_morphism(self, k, evaluations[k], hits[k], seconds[k])
+        return units
 
 
 @dataclass
@@ -133,19 +333,25 @@ class PhonemeSyllabificationRuleStore:
         if not phonemes:
             return [], []
 
-        matching_rule = next(
+        matching_index = next(
             (
-                rule
-                for rule in self.rules
+                i
+                for i, rule in enumerate(self.rules)
                 if len(rule.rules) <= len(phonemes)
-                and rule.matches(phonemes[-len(rule.rules) :])
+                and rule.matches_at(phonemes, len(phonemes) - len(rule.rules))
             ),
             None,
         )
 
-        if matching_rule is None:
+        if matching_index is None:
             return [], []
 
+        stats = instrumentation.active()
+        if stats is not None:
+            stats.record_rule_sequence(self, matching_index)
+
+        matching_rule = self.rules[matching_index]
+
         rule_length = len(matching_rule.rules)
         return phonemes[:-rule_length], phonemes[-rule_length:]
 
@@ -156,6 +362,11 @@ class Language:
     Represents a language, containing information such as language name, constants, syllabification rules,
     morphisms, and an optional ISO 639 code. The Language class provides an organized way to store
     language-specific data for processing phoneme sequences.
+    Analysis results are memoized per token in `analysis_cache`, which can be resized or cleared.
+    Every instance has its own cache, so a language derived with `dataclasses.replace`
+    does not see the analyses of the original.
+    `fingerprint` identifies the constants, rules and morphisms of the language and the
+    loquax release, for caches that outlive the process.
     """
 
     language_name: str
@@ -165,21 +376,78 @@ class Language:
     syllable_morphisms: MorphismStore["Syllable"]
     phoneme_morphisms: MorphismStore["Phoneme"]
     tokenizer: Tokenizer
+    analysis_cache: LRUCache = field(
+        default_factory=LRUCache, init=False, compare=False, repr=False
+    )
+
+    @cached_property
+    def phoneme_inventory(self) -> Dict[Tuple[str, Optional[str]], "Phoneme"]:
+        """
+        The interned phonemes of the language, keyed by (symbol, ipa). Every valid pair is
+        built once, and (symbol, None) maps to the phoneme carrying the default IPA.
+        """
+        features = self.constants.features
+        inventory: Dict[Tuple[str, Optional[str]], Phoneme] = {}
+        for symbol, equivalents in self.constants.equivalencies.items():
+            for ipa in equivalents:
+                inventory[(symbol, ipa)] = Phoneme.trusted(
+                    symbol, self, ipa, features.get(symbol, 0)
+                )
+            inventory[(symbol, None)] = inventory[(symbol, equivalents[0])]
+        return inventory
+
+    @cached_property
+    def fingerprint(self) -> str:
+        # The release is mixed in as well, since the analyses also depend on code outside
+        # the language (e.g. syllabification and phonology)
+        return fingerprint(
+            loquax.__version__,
+            self.constants,
+            self.syllabification_rules,
+            self.syllable_morphisms,
+            self.phoneme_morphisms,
+        )
 
+    def phoneme(self, symbol: str, ipa: Optional[str] = None) -> "Phoneme":
+        """
+        Return the interned phoneme for `symbol` (and `ipa`), raising a ValueError
+        like the Phoneme constructor does if the pair is not valid in this language.
+        """
+        phoneme = self.phoneme_inventory.get((symbol, ipa))
+        return phoneme if phoneme is not None else Phoneme(symbol, self, ipa)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Phoneme:
     """
     Class to represent a single phoneme or sound unit in a word.
+    Phonemes are immutable; `Language.phoneme` hands out shared instances.
     """
 
     val: str
-    lang: Language
+    lang: Language = field(hash=False)
     ipa: Optional[str] = None
+    features: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.validate_phoneme()
         self.assign_ipa()
+        object.__setattr__(
+            self, "features", self.lang.constants.features.get(self.val, 0)
+        )
+
+    @classmethod
+    def trusted(cls, val: str, lang: Language, ipa: str, features: int) -> "Phoneme":
+        """
+        Build a phoneme without validation, for callers that already know the
+        (val, ipa) pair is valid and have its feature bitmask at hand.
+        """
+        phoneme = object.__new__(cls)
+        object.__setattr__(phoneme, "val", val)
+        object.__setattr__(phoneme, "lang", lang)
+        object.__setattr__(phoneme, "ipa", ipa)
+        object.__setattr__(phoneme, "features", features)
+        return phoneme
 
     def validate_phoneme(self):
         if self.val not in self.lang.constants.equivalencies:
@@ -187,12 +455,11 @@ class Phoneme:
                 f"The symbol '{self.val}' is not a valid phoneme in the language: '{self.lang.language_name}'."
             )
 
-    def assign_ipa(self, ipa: str = None):
+    def assign_ipa(self):
+        equivalents = self.lang.constants.equivalencies[self.val]
         if self.ipa is None:
-            self.ipa = self.lang.constants.equivalencies[self.val][0]
-        elif self.ipa is not None:
-            self.ipa = ipa
-        elif self.ipa not in self.lang.constants.equivalencies[self.val]:
+            object.__setattr__(self, "ipa", equivalents[0])
+        elif self.ipa not in equivalents:
             raise ValueError(
                 f"""The IPA symbol '{self.ipa}' is not a valid equivalent for phoneme '{self.val}' 
                 in the language: '{self.lang.language_name}'."""
@@ -200,27 +467,27 @@ class Phoneme:
 
     @property
     def is_diphthong(self) -> bool:
-        return self.val in self.lang.constants.diphthongs
+        return bool(self.features & DIPHTHONG)
 
     @property
     def is_stop(self) -> bool:
-        return self.val in self.lang.constants.stop_letters
+        return bool(self.features & STOP)
 
     @property
     def is_liquid(self) -> bool:
-        return self.val in self.lang.constants.liquid_letters
+        return bool(self.features & LIQUID)
 
     @property
     def is_aspirate(self) -> bool:
-        return self.val in self.lang.constants.aspirates
+        return bool(self.features & ASPIRATE)
 
     @property
     def is_vowel(self) -> bool:
-        return self.val in self.lang.constants.vowels
+        return bool(self.features & VOWEL)
 
     @property
     def is_consonant(self) -> bool:
-        return self.val in self.lang.constants.consonants
+        return bool(self.features & CONSONANT)
 
     def set_ipa(self, new_ipa: str) -> "Phoneme":
         # Ensure the new IPA is a valid equivalent for this phoneme
@@ -229,8 +496,8 @@ class Phoneme:
                 f"""The IPA symbol '{new_ipa}' is not a valid equivalent for phoneme '{self.val}' 
                 in the language: '{self.lang.language_name}'."""
             )
-        # Return a new Phoneme with the same val and lang, but with the new IPA
-        return Phoneme(val=self.val, lang=self.lang, ipa=new_ipa)
+        # Return the interned Phoneme with the same val and lang, but with the new IPA
+        return self.lang.phoneme(self.val, new_ipa)
 
     def to_string(self, ipa: bool = False):
         if ipa:
@@ -245,64 +512,75 @@ class Phoneme:
         return self.__repr__()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Syllable:
     """
     Class to represent a syllable in a word.
     Syllable: List of Phonemes with an Onset, Nucleus, and Coda.
     O-N-C (Nucleus is a vowel, Onset and Coda are optional groups of consonants).
+    Syllables are immutable: the onset, nucleus, coda and string forms are computed once,
+    and `with_length` derives a syllable of another quantity without recomputing them.
     """
 
     phonemes: List[Phoneme]
     lang: Language
     is_long: bool = False
+    onset: List[Phoneme] = field(init=False, repr=False, compare=False)
+    nucleus: Optional[List[Phoneme]] = field(init=False, repr=False, compare=False)
+    coda: Optional[List[Phoneme]] = field(init=False, repr=False, compare=False)
+    val: str = field(init=False, repr=False, compare=False)
+    _ipa: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        num_vowels = len([p for p in self.phonemes if p.is_vowel])
-        if num_vowels > 1:
+        vowel_indices = [i for i, p in enumerate(self.phonemes) if p.features & VOWEL]
+        if len(vowel_indices) > 1:
             raise ValueError(
                 f"Invalid syllable: {self.phonemes} contains more than one vowel phoneme."
             )
 
-    @property
-    def nucleus(self) -> Optional[List[Phoneme]]:
-        first_vowel_index = self._find_first_vowel_index()
-        if first_vowel_index is not None:
-            return [self.phonemes[first_vowel_index]]
-        return None
-
-    @property
-    def onset(self) -> Optional[List[Phoneme]]:
-        first_vowel_index = self._find_first_vowel_index()
-        if first_vowel_index is not None:
-            return self.phonemes[:first_vowel_index]
-        return self.phonemes
-
-    @property
-    def coda(self) -> Optional[List[Phoneme]]:
-        first_vowel_index = self._find_first_vowel_index()
-        if first_vowel_index is not None:
-            return self.phonemes[first_vowel_index + 1 :]
-        return None
-
-    @property
-    def val(self) -> str:
-        return "".join([phoneme.val for phoneme in self.phonemes])
+        if vowel_indices:
+            first_vowel_index = vowel_indices[0]
+            onset = self.phonemes[:first_vowel_index]
+            nucleus = [self.phonemes[first_vowel_index]]
+            coda = self.phonemes[first_vowel_index + 1 :]
+        else:
+            onset, nucleus, coda = list(self.phonemes), None, None
+        object.__setattr__(self, "onset", onset)
+        object.__setattr__(self, "nucleus", nucleus)
+        object.__setattr__(self, "coda", coda)
+        object.__setattr__(
+            self, "val", "".join([phoneme.val for phoneme in self.phonemes])
+        )
 
-    def _find_first_vowel_index(self) -> Optional[int]:
-        return next((i for i, p in enumerate(self.phonemes) if p.is_vowel), None)
+    def with_length(self, is_long: bool) -> "Syllable":
+        """
+        Return this syllable with the given quantity, sharing its precomputed structure.
+        Equivalent to, but cheaper than, `dataclasses.replace(self, is_long=is_long)`.
+        """
+        syllable = object.__new__(Syllable)
+        for name in Syllable.__slots__:
+            object.__setattr__(syllable, name, getattr(self, name))
+        object.__setattr__(syllable, "is_long", is_long)
+        return syllable
 
     def scansion_str(self, ipa: bool = False) -> str:
         symbol = "u" if not self.is_long else "-"
-        return symbol.center(len(self.__repr__() if ipa else self.__str__()))
+        return symbol.center(len(self.val))
 
     def to_string(self, ipa: bool = False) -> str:
-        return "".join(
-            [phoneme.ipa if ipa else phoneme.val for phoneme in self.phonemes]
-        )
+        if not ipa:
+            return self.val
+        if self._ipa is None:
+            object.__setattr__(
+                self, "_ipa", "".join([phoneme.ipa for phoneme in self.phonemes])
+            )
+        return self._ipa
 
     def __repr__(self):
         return self.to_string(ipa=False)
 
     def __str__(self):
         return self.__repr__()
+
+
+_REPR_IS_VAL = frozenset([Phoneme, Syllable])
@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+from functools import cached_property
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from loquax.abstractions import Language, Phoneme, Syllable, LRUCache, instrumentation
+from loquax.abstractions.fingerprint import fingerprint
+
+
+@dataclass(frozen=True)
+class TokenAnalysis:
+    """
+    The outputs of the analysis stages for a single token. Analyses may be shared through
+    a cache, so their lists must not be modified.
+    """
+
+    token: str
+    phonemes: List[Phoneme] = field(default_factory=list)
+    syllables: List[Syllable] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    A named step of a Pipeline, turning the analysis of a token into a more complete one.
+    """
+
+    name: str
+    apply: Callable[[TokenAnalysis, Language], TokenAnalysis]
+
+
+@dataclass(frozen=True)
+class Pipeline:
+    """
+    Runs the analysis stages of a language over tokens, each stage exactly once per token:
+    the text is tokenized, then every token goes through `stages` in order, and the
+    resulting TokenAnalysis keeps every stage output for renderers to reuse.
+    When a `cache` is given, analyses are memoized per token.
+    """
+
+    language: Language
+    stages: Tuple[Stage, ...]
+    cache: Optional[LRUCache] = field(default=None, compare=False, repr=False)
+
+    @property
+    def stage_names(self) -> List[str]:
+        return [stage.name for stage in self.stages]
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        Identifies the analyses this pipeline produces: the fingerprint of its language
+        combined with the code of its stages.
+        """
+        return fingerprint(self.language.fingerprint, self.stages)
+
+    def tokenize(self, text: Union[str, Iterable[str]]) -> Iterator[str]:
+        tokenizer = self.language.tokenizer
+        stats = instrumentation.active()
+        if not isinstance(text, str):
+            tokens = tokenizer.tokenize_stream(text)
+            return tokens if stats is None else _timed_stream(tokens, stats)
+        if stats is None:
+            return iter(tokenizer.tokenize(text))
+        started = perf_counter()
+        tokens = tokenizer.tokenize(text)
+        stats.record_stage("tokenize", perf_counter() - started)
+        return iter(tokens)
+
+    def run(self, token: str) -> TokenAnalysis:
+        if self.cache is not None:
+            analysis = self.cache.get(token)
+            if analysis is not None:
+                return analysis
+
+        analysis = TokenAnalysis(token)
+        stats = instrumentation.active()
+        if stats is None:
+            for stage in self.stages:
+                analysis = stage.apply(analysis, self.language)
+        else:
+            for stage in self.stages:
+                started = perf_counter()
+                analysis = stage.apply(analysis, self.language)
+                stats.record_stage(stage.name, perf_counter() - started)
+
+        if self.cache is not None:
+            self.cache.put(token, analysis)
+        return analysis
+
+    def analyze(self, text: Union[str, Iterable[str]]) -> Iterator[TokenAnalysis]:
+        """
+        Lazily tokenize a text (or a stream of text chunks) and analyze every token.
+        """
+        return map(self.run, self.tokenize(text))
+
+    def without(self, *names: str) -> "Pipeline":
+        """
+        Return a copy of the pipeline skipping the named stages. The copy has no cache,
+        since its results differ from those of this pipeline.
+        """
+        self._check_names(names)
+        stages = tuple(stage for stage in self.stages if stage.name not in names)
+        return Pipeline(self.language, stages)
+
+    def replace_stage(self, name: str, stage: Stage) -> "Pipeline":
+        """
+        Return a copy of the pipeline running `stage` in place of the named stage.
+        The copy has no cache, since its results differ from those of this pipeline.
+        """
+        self._check_names([name])
+        stages = tuple(stage if s.name == name else s for s in self.stages)
+        return Pipeline(self.language, stages)
+
+    def _check_names(self, names: Iterable[str]):
+        unknown = [name for name in names if name not in self.stage_names]
+        if unknown:
+            raise ValueError(
+                f"Unknown pipeline stages {unknown}, expected some of {self.stage_names}."
+            )
+
+
+def _timed_stream(tokens: Iterator[str], stats: instrumentation.Stats) -> Iterator[str]:
+    # Only the time spent producing tokens counts, not the analysis of each token in
+    # between. The stream is recorded as one call once it is exhausted or closed.
+    seconds = 0.0
+    try:
+        while True:
+            started = perf_counter()
+            token = next(tokens, None)
+            seconds += perf_counter() - started
+            if token is None:
+                return
+            yield token
+    finally:
+        stats.record_stage("tokenize", seconds)
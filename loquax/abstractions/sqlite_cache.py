@@ -0,0 +1,156 @@
+import json
+import sqlite3
+from threading import Lock
+from typing import Dict, Optional
+
+from loquax.abstractions import Language, LRUCache, Syllable
+from loquax.abstractions.pipeline import TokenAnalysis
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    fingerprint TEXT NOT NULL,
+    token TEXT NOT NULL,
+    analysis TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, token)
+) WITHOUT ROWID
+"""
+
+
+def _encode(analysis: TokenAnalysis) -> str:
+    return json.dumps(
+        [
+            [[p.val, p.ipa] for p in analysis.phonemes],
+            [
+                [[[p.val, p.ipa] for p in s.phonemes], s.is_long]
+                for s in analysis.syllables
+            ],
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def _decode(token: str, value: str, lang: Language) -> TokenAnalysis:
+    phonemes, syllables = json.loads(value)
+    phoneme = lang.phoneme
+    return TokenAnalysis(
+        token,
+        [phoneme(val, ipa) for val, ipa in phonemes],
+        [
+            Syllable([phoneme(val, ipa) for val, ipa in members], lang, is_long)
+            for members, is_long in syllables
+        ],
+    )
+
+
+class SQLiteCache:
+    """
+    A persistent analysis cache, usable as the cache of a Pipeline, storing analyses in
+    a SQLite database keyed by (fingerprint, token). The fingerprint should identify
+    what produced the analyses (see `Pipeline.fingerprint`), so entries written by other
+    rules or stages are never returned and can be removed with `prune`.
+
+    Any number of processes may share a database: it runs in WAL mode, so readers never
+    block, and writers wait up to `timeout` seconds for each other. New entries are
+    buffered and written `batch_size` at a time; call `flush` (or `close`, or use the
+    cache as a context manager) to write the rest. Recently used analyses are also kept
+    in memory, in an LRUCache of `memory_size` entries.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        language: Language,
+        fingerprint: Optional[str] = None,
+        batch_size: int = 256,
+        memory_size: int = 8192,
+        timeout: float = 30.0,
+    ):
+        self.path = path
+        self.language = language
+        self.fingerprint = fingerprint or language.fingerprint
+        self.batch_size = batch_size
+        self.memory: LRUCache[str, TokenAnalysis] = LRUCache(memory_size)
+        self._pending: Dict[str, str] = {}
+        self._lock = Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+
+    def get(self, token: str) -> Optional[TokenAnalysis]:
+        analysis = self.memory.get(token)
+        if analysis is not None:
+            return analysis
+        with self._lock:
+            value = self._pending.get(token)
+            if value is None:
+                row = self._connection.execute(
+                    "SELECT analysis FROM analyses WHERE fingerprint = ? AND token = ?",
+                    (self.fingerprint, token),
+                ).fetchone()
+                if row is None:
+                    return None
+                value = row[0]
+        analysis = _decode(token, value, self.language)
+        self.memory.put(token, analysis)
+        return analysis
+
+    def put(self, token: str, analysis: TokenAnalysis) -> None:
+        self.memory.put(token, analysis)
+        with self._lock:
+            self._pending[token] = _encode(analysis)
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+
+    def flush(self) -> None:
+        """
+        Write the buffered entries to the database.
+        """
+        with self._lock:
+            self._write_pending()
+
+    def _write_pending(self):
+        if not self._pending:
+            return
+        rows = [(self.fingerprint, t, v) for t, v in self._pending.items()]
+        with self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO analyses VALUES (?, ?, ?)", rows
+            )
+        self._pending.clear()
+
+    def prune(self) -> int:
+        """
+        Delete the entries of every other fingerprint, returning how many were deleted.
+        """
+        self.flush()
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            cursor = self._connection.execute(
+                "DELETE FROM analyses WHERE fingerprint != ?", (self.fingerprint,)
+            )
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._write_pending()
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM analyses WHERE fingerprint = ?",
+                (self.fingerprint,),
+            ).fetchone()
+            return count
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "SQLiteCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,10 +1,18 @@
+from dataclasses import replace
 from typing import List
+from unicodedata import is_normalized, normalize
 
 from loquax.abstractions import Language, Syllable, Phoneme
 from loquax.abstractions.phonology import get_phonemes
+from loquax.abstractions.pipeline import Pipeline, Stage
 
 
-def get_syllables_from_phonemes(token: List[Phoneme], lang: Language) -> List[Syllable]:
+def syllabify(token: List[Phoneme], lang: Language) -> List[Syllable]:
+    """
+    Split a sequence of phonemes into syllables, one per vowel, without applying
+    the syllable morphisms of the language.
+    """
+
     # Helper function to create a Syllable based on current, previous, and next vowel indices
     def _create_syllable(
         tkn: List[Phoneme],
@@ -38,9 +46,9 @@ def get_syllables_from_phonemes(token: List[Phoneme], lang: Language) -> List[Sy
     # Create syllables based on the number of vowels and their positions
     match len(vowel_indices):
         case num_vowels if num_vowels <= 1:
-            return lang.syllable_morphisms.apply_all([Syllable(token, lang)])
+            return [Syllable(token, lang)]
         case _:
-            syllables: List[Syllable] = [
+            return [
                 _create_syllable(
                     token,
                     index,
@@ -52,10 +60,75 @@ def get_syllables_from_phonemes(token: List[Phoneme], lang: Language) -> List[Sy
                 for index in range(len(vowel_indices))
             ]
 
-            return lang.syllable_morphisms.apply_all(syllables)
+
+def get_syllables_from_phonemes(token: List[Phoneme], lang: Language) -> List[Syllable]:
+    return lang.syllable_morphisms.apply_all(syllabify(token, lang))
+
+
+"""
+ANALYSIS STAGES
+
+tokenize → normalize → segment → phoneme morphisms → syllabify → syllable morphisms → render
+(tokenizing and rendering are done by the Pipeline and Document respectively)
+"""
+NORMALIZE = Stage(
+    "normalize",
+    lambda analysis, lang: analysis
+    if is_normalized("NFC", analysis.token)
+    else replace(analysis, token=normalize("NFC", analysis.token)),
+)
+SEGMENT = Stage(
+    "segment",
+    lambda analysis, lang: replace(
+        analysis, phonemes=get_phonemes(analysis.token, lang)
+    ),
+)
+PHONEME_MORPHISMS = Stage(
+    "phoneme_morphisms",
+    lambda analysis, lang: replace(
+        analysis, phonemes=lang.phoneme_morphisms.apply_all(analysis.phonemes)
+    ),
+)
+SYLLABIFY = Stage(
+    "syllabify",
+    lambda analysis, lang: replace(
+        analysis, syllables=syllabify(analysis.phonemes, lang)
+    ),
+)
+SYLLABLE_MORPHISMS = Stage(
+    "syllable_morphisms",
+    lambda analysis, lang: replace(
+        analysis, syllables=lang.syllable_morphisms.apply_all(analysis.syllables)
+    ),
+)
+DEFAULT_STAGES = (
+    NORMALIZE,
+    SEGMENT,
+    PHONEME_MORPHISMS,
+    SYLLABIFY,
+    SYLLABLE_MORPHISMS,
+)
+
+
+def default_pipeline(lang: Language) -> Pipeline:
+    """
+    The standard analysis of a language, memoized in its analysis cache.
+    """
+    return Pipeline(lang, DEFAULT_STAGES, lang.analysis_cache)
+
+
+def persistent_pipeline(lang: Language, path: str) -> Pipeline:
+    """
+    The standard analysis of a language, memoized in the SQLite database at `path`, which
+    can be shared between processes and runs (see SQLiteCache). Call `cache.flush()` on
+    the returned pipeline once done to write the last entries.
+    """
+    # Imported here, as sqlite3 is a noticeable part of the import time of this module
+    from loquax.abstractions.sqlite_cache import SQLiteCache
+
+    pipeline = Pipeline(lang, DEFAULT_STAGES)
+    return replace(pipeline, cache=SQLiteCache(path, lang, pipeline.fingerprint))
 
 
 def get_syllables_from_token(token: str, lang: Language) -> List[Syllable]:
-    return lang.syllable_morphisms.apply_all(
-        get_syllables_from_phonemes(get_phonemes(token, lang), lang)
-    )
+    return list(default_pipeline(lang).run(token).syllables)
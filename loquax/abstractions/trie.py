@@ -0,0 +1,44 @@
+from typing import Dict, Iterable, List
+
+
+class SymbolTrie:
+    """
+    Longest-match lookup over a fixed set of symbols. Each node maps a character to its
+    child node, and the symbol ending at a node is stored under the empty-string key.
+    """
+
+    def __init__(self, symbols: Iterable[str]):
+        self.root: Dict[str, dict] = {}
+        for symbol in symbols:
+            node = self.root
+            for char in symbol:
+                node = node.setdefault(char, {})
+            node[""] = symbol
+
+    def segment(self, text: str) -> List[str]:
+        """
+        Split `text` in a single left-to-right pass, taking at each position the longest
+        symbol of the trie that starts there, or the single character if none does.
+
+        :param text: the string to segment
+        :return: the list of segments, which concatenate back to `text`
+        """
+        root = self.root
+        segments: List[str] = []
+        length = len(text)
+        start = 0
+        while start < length:
+            match, end = text[start], start + 1
+            node = root.get(match)
+            position = end
+            while node is not None:
+                symbol = node.get("")
+                if symbol is not None:
+                    match, end = symbol, position
+                if position == length:
+                    break
+                node = node.get(text[position])
+                position += 1
+            segments.append(match)
+            start = end
+        return segments
@@ -1 +1,110 @@
-from .latin import Latin
+from functools import partial
+from importlib import import_module
+from threading import RLock
+from typing import TYPE_CHECKING, Callable, Dict, List, Union
+
+if TYPE_CHECKING:
+    from loquax.abstractions import Language
+
+# Other packages can provide languages under this entry point group, naming each entry
+# point after the ISO 639 code and pointing it at a Language or at a function building
+# one, e.g. in setup.py:
+#
+#     entry_points={"loquax.languages": ["grc = loquax_greek:Greek"]}
+ENTRY_POINT_GROUP = "loquax.languages"
+
+# The bundled languages, by ISO 639 code and by the name they are importable under
+# (`from loquax.languages import Latin`). They are only built when first used.
+_BUNDLED: Dict[str, str] = {"lat": "loquax.languages.latin:Latin"}
+_NAMES: Dict[str, str] = {"Latin": "lat"}
+
+
+def _load(path: str) -> "Language":
+    module, _, attribute = path.partition(":")
+    return getattr(import_module(module), attribute)
+
+
+# The languages built so far, and how to build the others
+_languages: Dict[str, "Language"] = {}
+_factories: Dict[str, Callable[[], "Language"]] = {
+    iso_639_code: partial(_load, path) for iso_639_code, path in _BUNDLED.items()
+}
+_entry_points_loaded = False
+# Reentrant, since building a language may look up another (e.g. a dialect's base)
+_lock = RLock()
+
+
+def _load_entry_point(entry_point) -> "Language":
+    language = entry_point.load()
+    return language() if callable(language) else language
+
+
+def _discover():
+    # Entry points are only scanned when a language is not found among those bundled or
+    # registered, since looking them up means reading the metadata of every package
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name not in _languages and entry_point.name not in _factories:
+            _factories[entry_point.name] = partial(_load_entry_point, entry_point)
+    _entry_points_loaded = True
+
+
+def register_language(
+    iso_639_code: str, language: Union["Language", Callable[[], "Language"]]
+) -> None:
+    """
+    Register a language, or a function building it on first use, under an ISO 639 code.
+    """
+    with _lock:
+        _languages.pop(iso_639_code, None)
+        _factories.pop(iso_639_code, None)
+        if callable(language):
+            _factories[iso_639_code] = language
+        else:
+            _languages[iso_639_code] = language
+
+
+def get_language(iso_639_code: str) -> "Language":
+    """
+    Look up a language by its ISO 639 code, e.g. "lat", building it on first use.
+    """
+    language = _languages.get(iso_639_code)
+    if language is not None:
+        return language
+    with _lock:
+        language = _languages.get(iso_639_code)
+        if language is not None:
+            return language
+        if iso_639_code not in _factories:
+            _discover()
+        factory = _factories.get(iso_639_code)
+        if factory is None:
+            raise ValueError(
+                f"No language is registered under the ISO 639 code '{iso_639_code}'."
+            )
+        language = _languages[iso_639_code] = factory()
+        del _factories[iso_639_code]
+        return language
+
+
+def available_languages() -> List[str]:
+    """
+    The ISO 639 codes of every bundled, registered and installed language.
+    """
+    with _lock:
+        _discover()
+        return sorted(set(_languages) | set(_factories))
+
+
+def __getattr__(name: str):
+    if name in _NAMES:
+        return get_language(_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_NAMES))
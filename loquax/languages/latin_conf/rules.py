@@ -1,5 +1,3 @@
-from dataclasses import replace
-
 from loquax.abstractions import (
     PhonemeSyllabificationRuleStore,
     MorphismStore,
@@ -46,17 +44,17 @@ long_nature_morphism = Morphism[Syllable](
         check_fn=lambda s: s.nucleus
         and any(has_macron(p) or p.is_diphthong for p in s.nucleus)
     ),
-    transformation=lambda s: replace(s, is_long=True),
+    transformation=lambda s: s.with_length(True),
 )
 
 long_position_morphism_1 = Morphism[Syllable](
     target=Rule[Syllable](check_fn=lambda s: s.nucleus and s.coda and len(s.coda) >= 2),
-    transformation=lambda s: replace(s, is_long=True),
+    transformation=lambda s: s.with_length(True),
 )
 
 long_position_morphism_2 = Morphism[Syllable](
     target=Rule[Syllable](check_fn=lambda s: s.nucleus and s.coda and len(s.coda) >= 1),
-    transformation=lambda s: replace(s, is_long=True),
+    transformation=lambda s: s.with_length(True),
     suffix=RuleSequence(
         [Rule[Syllable](check_fn=lambda s: s.coda and len(s.onset) >= 1)]
     ),
@@ -64,7 +62,7 @@ long_position_morphism_2 = Morphism[Syllable](
 
 long_position_morphism_3 = Morphism[Syllable](
     target=Rule[Syllable](check_fn=lambda s: s.nucleus),
-    transformation=lambda s: replace(s, is_long=True),
+    transformation=lambda s: s.with_length(True),
     suffix=RuleSequence(
         [
             Rule[Syllable](
@@ -76,7 +74,7 @@ long_position_morphism_3 = Morphism[Syllable](
 
 long_position_morphism_4 = Morphism[Syllable](
     target=Rule[Syllable](check_fn=lambda s: s.nucleus),
-    transformation=lambda s: replace(s, is_long=True),
+    transformation=lambda s: s.with_length(True),
     suffix=RuleSequence(
         [
             Rule[Syllable](
@@ -89,7 +87,7 @@ long_position_morphism_4 = Morphism[Syllable](
 )
 long_position_morphism_5 = Morphism[Syllable](
     target=Rule[Syllable](check_fn=lambda s: s.nucleus and not s.coda),
-    transformation=lambda s: replace(s, is_long=True),
+    transformation=lambda s: s.with_length(True),
     suffix=RuleSequence(
         [Rule[Syllable](check_fn=lambda s: s.onset and len(s.onset) >= 2)]
     ),
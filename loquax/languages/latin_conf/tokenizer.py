@@ -1,24 +1,41 @@
 import re
-from functools import reduce
-from typing import List
+from unicodedata import is_normalized, normalize
+from typing import Iterator, List
 
-from loquax.abstractions import Tokenizer
+from loquax.abstractions import Tokenizer, TokenSpan
+
+# Punctuation and digits are dropped from tokens
+_DROPPED = re.compile(r"[^\w\s]|\d")
+# A token spans from the first to the last letter (a word character that is not a digit)
+# of a whitespace-delimited word, and the combining accents following that letter. Tokens
+# with nothing to drop between their letters, by far the most common, are captured by the
+# first group and need no further cleaning.
+_TOKEN = re.compile(
+    r"(?:([^\W\d]+)(?=(?:[^\w\s]|\d)*(?:\s|$))|[^\W\d](?:\S*[^\W\d])?)"
+    r"[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]*"
+)
 
 
 class LatinTokenizer(Tokenizer):
     """
-    Tokenizer for Classical Latin text.
+    Tokenizer for Classical Latin text: words are normalized to NFC (so that a combining
+    macron joins its vowel instead of being dropped), lowercased, and stripped of
+    punctuation and digits.
     """
 
     def tokenize(self, text: str) -> List[str]:
-        # This function takes multiple function arguments and composes
-        # them into a single function. The composed function applies the given functions in sequence.
-        compose = lambda *functions: reduce(
-            lambda f, g: lambda x: f(g(x)), functions, lambda x: x
-        )
-        transformations = compose(
-            str.lower,
-            lambda s: re.sub(r"[^\w\s]", "", s),
-            lambda s: re.sub(r"\d", "", s),
-        )
-        return transformations(text).split()
+        return _DROPPED.sub("", normalize("NFC", text).lower()).split()
+
+    def tokenize_spans(self, text: str) -> Iterator[TokenSpan]:
+        drop = _DROPPED.sub
+        lowered = text.lower()
+        if len(lowered) == len(text) and is_normalized("NFC", text):
+            for match in _TOKEN.finditer(lowered):
+                token = match[1] or drop("", match[0])
+                yield TokenSpan(token, match.start(), match.end())
+        else:
+            # Normalizing or lowercasing changes the length of the text, so offsets only
+            # hold in the original
+            for match in _TOKEN.finditer(text):
+                token = drop("", normalize("NFC", match.group()).lower())
+                yield TokenSpan(token, match.start(), match.end())
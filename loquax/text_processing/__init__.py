@@ -1,2 +1,3 @@
 from loquax.text_processing.processing import Document, Token
+from loquax.text_processing.incremental import EditableDocument
 from loquax.text_processing.commons import *
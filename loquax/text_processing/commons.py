@@ -1,28 +1,39 @@
-import unicodedata
-
 from loquax.abstractions import Phoneme
+from loquax.abstractions.constants import (
+    ACUTE,
+    GRAVE,
+    MACRON,
+    TILDE,
+    TREMA,
+    diacritic_flags,
+)
+
+
+def _diacritics(phoneme: Phoneme) -> int:
+    flags = phoneme.lang.constants.diacritics.get(phoneme.val)
+    return flags if flags is not None else diacritic_flags(phoneme.val)
 
 
 def has_macron(phoneme: Phoneme) -> bool:
     """Return True if any character in the phoneme's value has a macron accent."""
-    return any("macron" in unicodedata.name(c, "").lower() for c in phoneme.val)
+    return bool(_diacritics(phoneme) & MACRON)
 
 
 def has_trema(phoneme: Phoneme) -> bool:
     """Return True if any character in the phoneme's value has a trema (diaeresis) accent."""
-    return any("diaeresis" in unicodedata.name(c, "").lower() for c in phoneme.val)
+    return bool(_diacritics(phoneme) & TREMA)
 
 
 def has_acute(phoneme: Phoneme) -> bool:
     """Return True if any character in the phoneme's value has an acute accent."""
-    return any("acute" in unicodedata.name(c, "").lower() for c in phoneme.val)
+    return bool(_diacritics(phoneme) & ACUTE)
 
 
 def has_grave(phoneme: Phoneme) -> bool:
     """Return True if any character in the phoneme's value has a grave accent."""
-    return any("grave" in unicodedata.name(c, "").lower() for c in phoneme.val)
+    return bool(_diacritics(phoneme) & GRAVE)
 
 
 def has_tilde(phoneme: Phoneme) -> bool:
     """Return True if any character in the phoneme's value has a tilde accent."""
-    return any("tilde" in unicodedata.name(c, "").lower() for c in phoneme.val)
+    return bool(_diacritics(phoneme) & TILDE)
@@ -0,0 +1,251 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from loquax.abstractions import Language, Phoneme, Syllable
+from loquax.abstractions.columnar import PhonemeCodec
+from loquax.abstractions.pipeline import TokenAnalysis
+from loquax.languages import get_language
+
+MAGIC = b"LQXC"
+FORMAT_VERSION = 1
+# Columns start on multiples of this many bytes, so they can be viewed in place
+_ALIGNMENT = 8
+
+
+def _padding(size: int) -> bytes:
+    return b"\0" * (-size % _ALIGNMENT)
+
+
+def write_columnar(
+    path: str, analyses: Iterable[TokenAnalysis], language: Language
+) -> int:
+    """
+    Write analyzed tokens (e.g. `pipeline.analyze(text)`) to `path` in the columnar
+    format, returning the number of tokens written. The file holds a JSON header followed
+    by one aligned array per column:
+
+        token_text          UTF-8 text of all tokens, back to back
+        token_text_offsets  where each token starts in token_text (uint32, one extra)
+        token_syllables     where each token starts in the syllable columns (uint32, one extra)
+        syllable_phonemes   where each syllable starts in phoneme_ids (uint32, one extra)
+        syllable_long       the quantity of each syllable (uint8)
+        phoneme_ids         the phonemes of all syllables, indexing the header's phoneme table
+
+    Only the final syllables are stored, so the phonemes of a token are those of its
+    syllables.
+    """
+    codec = PhonemeCodec(language)
+    token_text = bytearray()
+    token_text_offsets = array("I", [0])
+    token_syllables = array("I", [0])
+    syllable_phonemes = array("I", [0])
+    syllable_long = array("B")
+    phoneme_ids = array(codec.typecode)
+    for analysis in analyses:
+        token_text += analysis.token.encode("utf-8")
+        token_text_offsets.append(len(token_text))
+        for syllable in analysis.syllables:
+            phoneme_ids.extend(codec.encode(syllable.phonemes))
+            syllable_phonemes.append(len(phoneme_ids))
+            syllable_long.append(syllable.is_long)
+        token_syllables.append(len(syllable_long))
+
+    columns: List[Tuple[str, str, Any]] = [
+        ("token_text", "B", token_text),
+        ("token_text_offsets", "I", token_text_offsets),
+        ("token_syllables", "I", token_syllables),
+        ("syllable_phonemes", "I", syllable_phonemes),
+        ("syllable_long", "B", syllable_long),
+        ("phoneme_ids", codec.typecode, phoneme_ids),
+    ]
+    descriptors, offset = [], 0
+    for name, typecode, data in columns:
+        size = memoryview(data).nbytes
+        descriptors.append(
+            {"name": name, "typecode": typecode, "offset": offset, "size": size}
+        )
+        offset += size + len(_padding(size))
+
+    header = json.dumps(
+        {
+            "format": FORMAT_VERSION,
+            "language": language.iso_639_code,
+            "byteorder": sys.byteorder,
+            "tokens": len(token_syllables) - 1,
+            "phonemes": [[p.val, p.ipa] for p in codec.phonemes],
+            "columns": descriptors,
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+    prefix = MAGIC + struct.pack("<I", len(header)) + header
+    with open(path, "wb") as f:
+        f.write(prefix + _padding(len(prefix)))
+        for _, _, data in columns:
+            f.write(data)
+            f.write(_padding(memoryview(data).nbytes))
+    return len(token_syllables) - 1
+
+
+class ColumnarReader:
+    """
+    A corpus written by `write_columnar`, memory-mapped: opening it only parses the header,
+    and the columns are exposed as memoryviews over the file (e.g. `reader.syllable_long`)
+    for bulk processing without building any objects. Tokens, syllables and analyses are
+    rebuilt on demand with the language the corpus was analyzed with.
+
+        with ColumnarReader("aeneid.lqx") as corpus:
+            long_ratio = sum(corpus.syllable_long) / len(corpus.syllable_long)
+    """
+
+    def __init__(self, path: str, language: Optional[Language] = None):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = [memoryview(self._mmap)]
+        self._syllables: Dict[Tuple[bytes, int], Syllable] = {}
+        try:
+            self._load(language)
+        except BaseException:
+            self.close()
+            raise
+
+    def _load(self, language: Optional[Language]):
+        buffer = self._views[0]
+        if bytes(buffer[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a loquax columnar file.")
+        (header_size,) = struct.unpack_from("<I", buffer, len(MAGIC))
+        header_end = len(MAGIC) + 4 + header_size
+        self.header: Dict[str, Any] = json.loads(
+            bytes(buffer[len(MAGIC) + 4 : header_end]).decode("utf-8")
+        )
+        if self.header["format"] != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported columnar format version {self.header['format']}."
+            )
+
+        self.language = language or get_language(self.header["language"])
+        self.phonemes: List[Phoneme] = [
+            self.language.phoneme(val, ipa) for val, ipa in self.header["phonemes"]
+        ]
+        data_start = header_end + len(_padding(header_end))
+        for column in self.header["columns"]:
+            start = data_start + column["offset"]
+            raw = buffer[start : start + column["size"]]
+            self._views.append(raw)
+            if self.header["byteorder"] == sys.byteorder:
+                values = raw.cast(column["typecode"])
+                self._views.append(values)
+            else:
+                values = array(column["typecode"])
+                values.frombytes(raw)
+                values.byteswap()
+            setattr(self, column["name"], values)
+
+    def __len__(self) -> int:
+        return self.header["tokens"]
+
+    def token(self, index: int) -> str:
+        start, end = self.token_text_offsets[index], self.token_text_offsets[index + 1]
+        return bytes(self.token_text[start:end]).decode("utf-8")
+
+    def syllable(self, index: int) -> Syllable:
+        """
+        Rebuild the syllable at `index` of the syllable columns. Syllables are immutable,
+        so each distinct one is built once and shared.
+        """
+        start, end = self.syllable_phonemes[index], self.syllable_phonemes[index + 1]
+        key = (bytes(self.phoneme_ids[start:end]), self.syllable_long[index])
+        syllable = self._syllables.get(key)
+        if syllable is None:
+            phonemes = self.phonemes
+            syllable = self._syllables[key] = Syllable(
+                [phonemes[i] for i in self.phoneme_ids[start:end]],
+                self.language,
+                bool(key[1]),
+            )
+        return syllable
+
+    def syllables(self, index: int) -> List[Syllable]:
+        start, end = self.token_syllables[index], self.token_syllables[index + 1]
+        return [self.syllable(s) for s in range(start, end)]
+
+    def analysis(self, index: int) -> TokenAnalysis:
+        syllables = self.syllables(index)
+        return TokenAnalysis(
+            self.token(index),
+            [phoneme for syllable in syllables for phoneme in syllable.phonemes],
+            syllables,
+        )
+
+    def __iter__(self) -> Iterator[TokenAnalysis]:
+        return (self.analysis(i) for i in range(len(self)))
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+
+    def __enter__(self) -> "ColumnarReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_jsonl(fp: IO[str], analyses: Iterable[TokenAnalysis]) -> int:
+    """
+    Write analyzed tokens as JSON lines, one object per token, returning the number of
+    tokens written:
+
+        {"token": "arma", "syllables": [{"val": "ar", "ipa": "ar", "long": false,
+         "phonemes": [["a", "a"], ["r", "r"]]}, ...]}
+    """
+    count = 0
+    for analysis in analyses:
+        record = {
+            "token": analysis.token,
+            "syllables": [
+                {
+                    "val": syllable.to_string(),
+                    "ipa": syllable.to_string(ipa=True),
+                    "long": syllable.is_long,
+                    "phonemes": [[p.val, p.ipa] for p in syllable.phonemes],
+                }
+                for syllable in analysis.syllables
+            ],
+        }
+        fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def read_jsonl(
+    fp: Iterable[str], language: Union[str, Language]
+) -> Iterator[TokenAnalysis]:
+    """
+    Read back the analyses written by `write_jsonl`.
+    """
+    if isinstance(language, str):
+        language = get_language(language)
+    phoneme = language.phoneme
+    for line in fp:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        syllables = [
+            Syllable(
+                [phoneme(val, ipa) for val, ipa in syllable["phonemes"]],
+                language,
+                syllable["long"],
+            )
+            for syllable in record["syllables"]
+        ]
+        yield TokenAnalysis(
+            record["token"],
+            [p for syllable in syllables for p in syllable.phonemes],
+            syllables,
+        )
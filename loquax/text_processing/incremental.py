@@ -0,0 +1,171 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loquax.abstractions import Language, Syllable, TokenSpan
+from loquax.abstractions.pipeline import Pipeline, TokenAnalysis
+from loquax.abstractions.syllabification import default_pipeline
+from loquax.text_processing.render import (
+    LineWrapper,
+    join_scansion,
+    join_syllables,
+)
+
+
+@dataclass
+class _Layout:
+    """
+    One kind of rendered line (syllables or scansion, plain or IPA): the rendering of
+    every token, the wrapped lines, and the index of the token each line starts with.
+    """
+
+    render: Callable[[List[Syllable]], str]
+    pieces: List[str] = field(default_factory=list)
+    lines: List[str] = field(default_factory=list)
+    starts: List[int] = field(default_factory=list)
+
+    def rewrap(self, max_line_width: int, first: int = 0, end: int = 0, shift: int = 0):
+        """
+        Re-wrap the lines after the pieces from `first` to `end` were replaced, changing
+        the number of pieces by `shift`. Wrapping restarts on the line holding the piece
+        before `first` (the replaced pieces may fit on it now), and stops as soon as a
+        line starts on the same unchanged piece as before: the lines that follow are the
+        same greedy wrapping of the same pieces.
+        """
+        old_lines, old_starts = self.lines, self.starts
+        line = bisect_right(old_starts, first - 1) - 1 if first > 0 else 0
+        wrapper = LineWrapper(max_line_width)
+        if line > 0:
+            begin = old_starts[line]
+            wrapper.line = self.pieces[begin]
+            next_piece = begin + 1
+        else:
+            # Wrapping from the very start, where the empty first line may be emitted
+            line, begin, next_piece = 0, 0, 0
+        lines, starts = old_lines[:line], old_starts[:line]
+
+        for i in range(next_piece, len(self.pieces)):
+            wrapped = wrapper.push(self.pieces[i])
+            if wrapped is None:
+                continue
+            lines.append(wrapped)
+            starts.append(begin)
+            begin = i
+            if i >= end and i > 0:
+                old = bisect_right(old_starts, i - shift) - 1
+                if old >= 0 and old_starts[old] == i - shift:
+                    self.lines = lines + old_lines[old:]
+                    self.starts = starts + [s + shift for s in old_starts[old:]]
+                    return
+        lines.append(wrapper.flush())
+        starts.append(begin)
+        self.lines, self.starts = lines, starts
+
+
+@dataclass
+class EditableDocument:
+    """
+    A Document kept up to date under edits, for editors that re-render on every change.
+    `edit` re-tokenizes only the words touched by the edit, analyzes only the tokens it
+    produced, and re-wraps lines from the one before the first changed token until the
+    wrapping lines up with the previous one again. Rendered lines are the same as those
+    of a Document of the current text. Requires a tokenizer reporting token offsets.
+    """
+
+    text: str
+    language: Language
+    max_line_width: int = 90
+    pipeline: Optional[Pipeline] = field(default=None, repr=False, compare=False)
+    analyses: List[TokenAnalysis] = field(init=False, repr=False, compare=False)
+    _starts: List[int] = field(init=False, repr=False, compare=False)
+    _ends: List[int] = field(init=False, repr=False, compare=False)
+    _layouts: Dict[Tuple[str, bool], _Layout] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.pipeline is None:
+            self.pipeline = default_pipeline(self.language)
+        spans = list(self.language.tokenizer.tokenize_spans(self.text))
+        self.analyses = [self.pipeline.run(span.token) for span in spans]
+        self._starts = [span.start for span in spans]
+        self._ends = [span.end for span in spans]
+        self._layouts = {}
+
+    @property
+    def spans(self) -> List[TokenSpan]:
+        """
+        The tokens of the current text, with their offsets in it.
+        """
+        return [
+            TokenSpan(analysis.token, start, end)
+            for analysis, start, end in zip(self.analyses, self._starts, self._ends)
+        ]
+
+    def edit(self, start: int, end: int, replacement: str) -> None:
+        """
+        Replace `text[start:end]` with `replacement`.
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(
+                f"Invalid edit range [{start}, {end}) of a text of length {len(self.text)}."
+            )
+        text = self.text
+        # Widen the edit to whole words, the units the tokenizer works on
+        left = start
+        while left and not text[left - 1].isspace():
+            left -= 1
+        right = end
+        while right < len(text) and not text[right].isspace():
+            right += 1
+
+        shift = len(replacement) - (end - start)
+        text = text[:start] + replacement + text[end:]
+        spans = list(self.language.tokenizer.tokenize_spans(text[left : right + shift]))
+        analyses = [self.pipeline.run(span.token) for span in spans]
+        first = bisect_left(self._starts, left)
+        last = bisect_left(self._starts, right)
+
+        # The analysis succeeded, so the edit can be applied. Tokens after it move by
+        # the change in length.
+        self.text = text
+        self._starts[first:] = [left + span.start for span in spans] + [
+            offset + shift for offset in self._starts[last:]
+        ]
+        self._ends[first:] = [left + span.end for span in spans] + [
+            offset + shift for offset in self._ends[last:]
+        ]
+        self.analyses[first:last] = analyses
+
+        end_piece, piece_shift = first + len(analyses), len(analyses) - (last - first)
+        for layout in self._layouts.values():
+            layout.pieces[first:last] = [
+                layout.render(analysis.syllables) for analysis in analyses
+            ]
+            layout.rewrap(self.max_line_width, first, end_piece, piece_shift)
+
+    def _layout(self, kind: str, ipa: bool) -> _Layout:
+        layout = self._layouts.get((kind, ipa))
+        if layout is None:
+            join = join_syllables if kind == "syllables" else join_scansion
+            layout = _Layout(lambda syllables: join(syllables, ipa))
+            layout.pieces = [layout.render(a.syllables) for a in self.analyses]
+            layout.rewrap(self.max_line_width)
+            self._layouts[(kind, ipa)] = layout
+        return layout
+
+    def lines(self, ipa: bool = False, scansion: bool = False) -> List[str]:
+        """
+        The rendered lines, as `Document.lines` would produce them for the current text.
+        """
+        syllable_lines = self._layout("syllables", ipa).lines
+        if not scansion:
+            return list(syllable_lines)
+        scansion_lines = self._layout("scansion", ipa).lines
+        return [line for pair in zip(syllable_lines, scansion_lines) for line in pair]
+
+    def to_string(self, ipa: bool = False, scansion: bool = False) -> str:
+        return "\n".join(self.lines(ipa, scansion))
+
+    def __repr__(self):
+        return self.to_string(ipa=True, scansion=True)
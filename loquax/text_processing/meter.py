@@ -0,0 +1,281 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from loquax.abstractions import Language, LRUCache, Syllable
+from loquax.abstractions.pipeline import Pipeline
+from loquax.abstractions.syllabification import default_pipeline
+
+# Quantity marks: a long position, a short position, and a position taking either
+LONG, SHORT, ANCEPS = "-", "u", "x"
+
+FOOT_NAMES = {
+    "-uu": "dactyl",
+    "--": "spondee",
+    "-u": "trochee",
+    "-": "long",
+    "u": "short",
+}
+
+# Never reading an unmarked syllable long would be costlier than any scansion
+_UNSCANNABLE = float("inf")
+
+# The number of line quantity patterns whose scan every meter keeps
+SCAN_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class Meter:
+    """
+    A verse form as a sequence of slots, each listing the quantity patterns of the feet
+    that may fill it, e.g. ("-uu", "--") for a foot that is a dactyl or a spondee.
+    Scans are memoized per line quantity pattern, which repeat a lot across a poem, for
+    the SCAN_CACHE_SIZE most recently scanned patterns.
+    """
+
+    name: str
+    slots: Tuple[Tuple[str, ...], ...]
+    # Divisions are cached wrapped in a 1-tuple, since None (unscannable) is a result
+    _scans: LRUCache[str, Tuple[Optional[Tuple[str, ...]]]] = field(
+        default_factory=lambda: LRUCache(SCAN_CACHE_SIZE),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def divide(self, quantities: str) -> Optional[Tuple[str, ...]]:
+        """
+        Divide a line's quantities (LONG for syllables known to be long, SHORT for the
+        others) into the feet of this meter, as the realized pattern of every foot.
+        Syllables not marked long may be read long (their vowel may be long by nature
+        without a macron); the division reading the fewest of them long is returned, or
+        None if there is none.
+        """
+        scan = self._scans.get(quantities)
+        if scan is None:
+            scan = (self._divide(quantities),)
+            self._scans.put(quantities, scan)
+        return scan[0]
+
+    def _divide(self, quantities: str) -> Optional[Tuple[str, ...]]:
+        n = len(quantities)
+        # best[j][i]: the least cost of filling the first j slots with the first i
+        # syllables, and the foot pattern ending there
+        best: List[List[Tuple[float, Optional[str]]]] = [
+            [(_UNSCANNABLE, None)] * (n + 1) for _ in range(len(self.slots) + 1)
+        ]
+        best[0][0] = (0, None)
+        for j, feet in enumerate(self.slots):
+            for i in range(n):
+                cost = best[j][i][0]
+                if cost == _UNSCANNABLE:
+                    continue
+                for foot in feet:
+                    end = i + len(foot)
+                    if end > n:
+                        continue
+                    foot_cost = _foot_cost(foot, quantities[i:end])
+                    if cost + foot_cost < best[j + 1][end][0]:
+                        best[j + 1][end] = (cost + foot_cost, foot)
+
+        if best[len(self.slots)][n][0] == _UNSCANNABLE:
+            return None
+        feet: List[str] = []
+        end = n
+        for j in range(len(self.slots), 0, -1):
+            foot = best[j][end][1]
+            realized = "".join(
+                q if mark == ANCEPS else mark
+                for mark, q in zip(foot, quantities[end - len(foot) : end])
+            )
+            feet.append(realized)
+            end -= len(foot)
+        return tuple(reversed(feet))
+
+
+def _foot_cost(foot: str, quantities: str) -> float:
+    cost = 0
+    for mark, quantity in zip(foot, quantities):
+        if mark == SHORT and quantity == LONG:
+            return _UNSCANNABLE
+        if mark == LONG and quantity == SHORT:
+            cost += 1
+    return cost
+
+
+HEXAMETER = Meter("dactylic hexameter", (("-uu", "--"),) * 5 + (("-x",),))
+PENTAMETER = Meter(
+    "dactylic pentameter",
+    (("-uu", "--"),) * 2 + (("-",), ("-uu",), ("-uu",), ("x",)),
+)
+
+
+@dataclass(frozen=True)
+class Foot:
+    pattern: str
+    syllables: List[Syllable]
+
+    @property
+    def name(self) -> str:
+        return FOOT_NAMES.get(self.pattern, "anceps")
+
+    def to_string(self, ipa: bool = False) -> str:
+        return ".".join(syllable.to_string(ipa) for syllable in self.syllables)
+
+
+@dataclass(frozen=True)
+class Scansion:
+    """
+    The scansion of a verse line: its syllables after elision, with the quantities they
+    were read with, divided into feet. `feet` is empty when the line is unscannable.
+    """
+
+    line: str
+    meter: Meter
+    syllables: List[Syllable]
+    feet: List[Foot]
+
+    @property
+    def scannable(self) -> bool:
+        return bool(self.feet)
+
+    @property
+    def pattern(self) -> str:
+        """
+        The quantities of the line, with feet separated by "|", e.g. "-uu|-uu|--|...".
+        """
+        if not self.feet:
+            return "".join(LONG if s.is_long else SHORT for s in self.syllables)
+        return "|".join(foot.pattern for foot in self.feet)
+
+    def to_string(self, ipa: bool = False) -> str:
+        if not self.feet:
+            return ".".join(syllable.to_string(ipa) for syllable in self.syllables)
+        return " | ".join(foot.to_string(ipa) for foot in self.feet)
+
+    def __repr__(self):
+        return self.to_string()
+
+
+def _elides(syllable: Syllable, following: Syllable) -> bool:
+    # A final vowel, or vowel and m, is elided before an initial vowel or h and vowel
+    ends_open = syllable.nucleus is not None and (
+        not syllable.coda or (len(syllable.coda) == 1 and syllable.coda[0].val == "m")
+    )
+    starts_open = following.nucleus is not None and (
+        not following.onset
+        or (len(following.onset) == 1 and following.onset[0].val == "h")
+    )
+    return ends_open and starts_open
+
+
+def _long_by_position(syllable: Syllable, following: Syllable) -> bool:
+    # The word-internal position rules of the language, applied across a word boundary.
+    # An initial h does not make position.
+    onset = [p for p in following.onset if p.val != "h"]
+    if syllable.nucleus is None:
+        return False
+    return (bool(syllable.coda) and len(onset) >= 1) or len(onset) >= 2
+
+
+def _consonantal_i(word: List[Syllable]) -> List[Syllable]:
+    # A short i before a vowel is a consonant when it starts the word (iam, Iūnō) or
+    # stands between vowels (Trōia, where it is doubled and closes the syllable before).
+    # A doubling spelled out (Trōiia, eiius) is the same single consonant.
+    lang = word[0].lang
+    if "j" not in lang.constants.consonant_equivalencies:
+        return word
+    syllables = list(word)
+    k = 0
+    while k < len(syllables) - 1:
+        syllable, following = syllables[k], syllables[k + 1]
+        previous = syllables[k - 1] if k else None
+        if (
+            len(syllable.phonemes) == 1
+            and syllable.val == "i"
+            and following.nucleus is not None
+            and not following.onset
+            and (
+                previous is None or (previous.nucleus is not None and not previous.coda)
+            )
+        ):
+            if len(following.phonemes) > 1 or following.val != "i":
+                syllables[k + 1] = Syllable(
+                    [lang.phoneme("j")] + following.phonemes, lang, following.is_long
+                )
+            # The following syllable now stands at k, and is checked next: the second i
+            # of a doubling is read as a consonant in turn
+            del syllables[k]
+            if previous is not None:
+                syllables[k - 1] = previous.with_length(True)
+        else:
+            k += 1
+    return syllables
+
+
+def line_syllables(words: List[List[Syllable]], elision: bool = True) -> List[Syllable]:
+    """
+    Join the syllables of the words of a line into one sequence, reading a short i
+    before a vowel as a consonant, eliding final syllables, and lengthening syllables
+    closed by the consonants of the next word.
+    """
+    syllables: List[Syllable] = []
+    words = [_consonantal_i(word) for word in words if word]
+    for w, word in enumerate(words):
+        following = words[w + 1][0] if w + 1 < len(words) else None
+        last = word[-1]
+        if following is not None and elision and _elides(last, following):
+            syllables.extend(word[:-1])
+            continue
+        syllables.extend(word)
+        if following is not None and not last.is_long:
+            if _long_by_position(last, following):
+                syllables[-1] = last.with_length(True)
+    return syllables
+
+
+def scan_line(
+    line: str,
+    language: Language,
+    meter: Meter = HEXAMETER,
+    elision: bool = True,
+    pipeline: Optional[Pipeline] = None,
+) -> Scansion:
+    """
+    Scan a verse line in `meter`, e.g. `scan_line("Arma virumque canō, ...", Latin)`.
+    """
+    pipeline = pipeline or default_pipeline(language)
+    words = [list(analysis.syllables) for analysis in pipeline.analyze(line)]
+    syllables = line_syllables(words, elision)
+    quantities = "".join(LONG if s.is_long else SHORT for s in syllables)
+
+    division = meter.divide(quantities)
+    if division is None:
+        return Scansion(line, meter, syllables, [])
+
+    feet: List[Foot] = []
+    scanned: List[Syllable] = []
+    start = 0
+    for pattern in division:
+        members = [
+            syllable.with_length(mark == LONG)
+            for syllable, mark in zip(syllables[start : start + len(pattern)], pattern)
+        ]
+        feet.append(Foot(pattern, members))
+        scanned.extend(members)
+        start += len(pattern)
+    return Scansion(line, meter, scanned, feet)
+
+
+def scan_lines(
+    lines: Iterable[str],
+    language: Language,
+    meter: Meter = HEXAMETER,
+    elision: bool = True,
+) -> Iterator[Scansion]:
+    """
+    Lazily scan every non-blank line of a poem in `meter`.
+    """
+    pipeline = default_pipeline(language)
+    for line in lines:
+        if line.strip():
+            yield scan_line(line, language, meter, elision, pipeline)
@@ -0,0 +1,173 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from os import cpu_count
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from loquax.abstractions import Language, Pipeline
+from loquax.abstractions.syllabification import persistent_pipeline
+from loquax.languages import get_language
+from loquax.text_processing.processing import Document
+from loquax.text_processing.statistics import CorpusStatistics
+
+A = TypeVar("A")
+B = TypeVar("B")
+
+
+def _resolve(language: Union[str, Language]) -> str:
+    # Languages hold lambdas and cannot be pickled, so workers receive the ISO 639 code
+    # and look the language up in their own registry
+    if isinstance(language, str):
+        return get_language(language).iso_639_code
+    if get_language(language.iso_639_code) is not language:
+        raise ValueError(
+            f"The language '{language.language_name}' is not the one registered under "
+            f"'{language.iso_639_code}', so worker processes cannot load it."
+        )
+    return language.iso_639_code
+
+
+def _apply_batch(fn: Callable[[A], B], batch: List[A]) -> List[B]:
+    return [fn(item) for item in batch]
+
+
+def map_ordered(
+    fn: Callable[[A], B],
+    items: Iterable[A],
+    processes: Optional[int] = None,
+    chunksize: int = 16,
+) -> Iterator[B]:
+    """
+    Apply a picklable function to every item in a pool of worker processes, yielding
+    results in input order. Items are shipped in batches of `chunksize`, and only a
+    bounded number of batches are in flight, so `items` may be an unbounded stream.
+    """
+    workers = processes or cpu_count() or 1
+    iter_items = iter(items)
+    batches = iter(lambda: list(islice(iter_items, chunksize)), [])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: Deque[Future] = deque(
+            pool.submit(_apply_batch, fn, batch)
+            for batch in islice(batches, 2 * workers)
+        )
+        while in_flight:
+            results = in_flight.popleft().result()
+            for batch in islice(batches, 1):
+                in_flight.append(pool.submit(_apply_batch, fn, batch))
+            yield from results
+
+
+# The persistent pipelines of this process, by (ISO 639 code, database path)
+_persistent_pipelines: Dict[Tuple[str, str], Pipeline] = {}
+
+
+def render_lines(
+    iso_639_code: str,
+    max_line_width: int,
+    ipa: bool,
+    scansion: bool,
+    text: str,
+    cache_path: Optional[str] = None,
+) -> List[str]:
+    """
+    Render a text of the language registered under `iso_639_code` as the lines of
+    `Document.lines`. Every argument can be pickled, so this can be submitted to worker
+    processes; with a `cache_path`, workers share their analyses through that SQLite
+    database.
+    """
+    language = get_language(iso_639_code)
+    if cache_path is None:
+        return list(Document(text, language, max_line_width).lines(ipa, scansion))
+
+    pipeline = _persistent_pipelines.get((iso_639_code, cache_path))
+    if pipeline is None:
+        pipeline = _persistent_pipelines[(iso_639_code, cache_path)] = (
+            persistent_pipeline(language, cache_path)
+        )
+    lines = list(
+        Document(text, language, max_line_width, pipeline).lines(ipa, scansion)
+    )
+    # Worker processes are not told when the pool shuts down, so write every text's
+    # new analyses right away
+    pipeline.cache.flush()
+    return lines
+
+
+def render_text(
+    iso_639_code: str,
+    max_line_width: int,
+    ipa: bool,
+    scansion: bool,
+    text: str,
+    cache_path: Optional[str] = None,
+) -> str:
+    """
+    Like `render_lines`, as the string `Document.to_string` would return.
+    """
+    return "\n".join(
+        render_lines(iso_639_code, max_line_width, ipa, scansion, text, cache_path)
+    )
+
+
+def analyze_corpus(
+    texts: Iterable[str],
+    language: Union[str, Language],
+    ipa: bool = False,
+    scansion: bool = False,
+    max_line_width: int = 90,
+    processes: Optional[int] = None,
+    chunksize: int = 16,
+    cache_path: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Render every text of a corpus as `Document.to_string` would, sharding the texts
+    across a pool of worker processes. Results are yielded in the order of `texts`.
+
+    :param texts: the texts to analyze, e.g. one per work, chapter or line
+    :param language: a registered Language, or its ISO 639 code
+    :param processes: the number of worker processes, defaulting to the CPU count
+    :param chunksize: the number of texts sent to a worker at a time
+    :param cache_path: a SQLite database in which workers share analyses across runs
+    """
+    render = partial(
+        render_text,
+        _resolve(language),
+        max_line_width,
+        ipa,
+        scansion,
+        cache_path=cache_path,
+    )
+    return map_ordered(render, texts, processes, chunksize)
+
+
+def _count(iso_639_code: str, text: str) -> CorpusStatistics:
+    return CorpusStatistics.from_text(text, get_language(iso_639_code))
+
+
+def corpus_statistics(
+    texts: Iterable[str],
+    language: Union[str, Language],
+    processes: Optional[int] = None,
+    chunksize: int = 16,
+) -> CorpusStatistics:
+    """
+    Count over every text of a corpus in a pool of worker processes, merging the
+    statistics of each text as they come back.
+    """
+    statistics = CorpusStatistics()
+    count = partial(_count, _resolve(language))
+    for shard in map_ordered(count, texts, processes, chunksize):
+        statistics.merge(shard)
+    return statistics
@@ -1,9 +1,17 @@
-from dataclasses import dataclass
-from functools import reduce
-from typing import List, Callable
+from dataclasses import dataclass, field
+from functools import cached_property
+from io import StringIO
+from typing import IO, Iterable, Iterator, List, Optional, Union
 
 from loquax.abstractions import Language, Syllable
-from loquax.abstractions.syllabification import get_syllables_from_token
+from loquax.abstractions.pipeline import Pipeline, TokenAnalysis
+from loquax.abstractions.syllabification import default_pipeline
+from loquax.text_processing.render import (
+    join_scansion,
+    join_syllables,
+    wrap_lines,
+    write_lines,
+)
 
 
 @dataclass
@@ -14,36 +22,22 @@ class Token:
 
     value: str
     language: Language
+    pipeline: Optional[Pipeline] = field(default=None, repr=False, compare=False)
+
+    @cached_property
+    def analysis(self) -> TokenAnalysis:
+        pipeline = self.pipeline or default_pipeline(self.language)
+        return pipeline.run(self.value)
 
     @property
     def syllables(self) -> List[Syllable]:
-        return get_syllables_from_token(self.value, self.language)
+        return list(self.analysis.syllables)
 
     def to_string(self, ipa: bool = False, scansion: bool = False) -> str:
-        syllable_reprs: List[str] = list(
-            map(lambda syl: syl.to_string(ipa), self.syllables)
-        )
-        syllable_repr_str: str = reduce(
-            lambda acc, repr: acc + "." + repr, syllable_reprs
-        )
-
+        syllables = self.syllables
         if scansion:
-            center_scansion: Callable[
-                [str, Syllable], str
-            ] = lambda syllable_repr, syllable: syllable.scansion_str(ipa).center(
-                len(syllable_repr)
-            )
-
-            scansion_reprs: List[str] = list(
-                map(center_scansion, syllable_reprs, self.syllables)
-            )
-            scansion_repr_str: str = "\n" + reduce(
-                lambda acc, repr: acc + " " + repr, scansion_reprs
-            )
-
-            return syllable_repr_str + scansion_repr_str
-
-        return syllable_repr_str
+            return join_syllables(syllables, ipa) + "\n" + join_scansion(syllables, ipa)
+        return join_syllables(syllables, ipa)
 
     def __repr__(self):
         return self.to_string(ipa=True)
@@ -53,54 +47,48 @@ class Token:
 class Document:
     """
     Class to represent a text or sequence of tokens.
+    The text can be a string, or an iterable of text chunks such as an open file, in which
+    case it is tokenized and rendered incrementally and can only be consumed once.
+    Analysis goes through `pipeline`, which defaults to the standard pipeline of the language.
     """
 
-    val: str
+    val: Union[str, Iterable[str]]
     language: Language
     max_line_width: int = 90  # change this as per your requirement
+    pipeline: Optional[Pipeline] = field(default=None, repr=False, compare=False)
+
+    def iter_tokens(self) -> Iterator[Token]:
+        pipeline = self.pipeline or default_pipeline(self.language)
+        return (
+            Token(value, self.language, pipeline)
+            for value in pipeline.tokenize(self.val)
+        )
 
     @property
     def tokens(self) -> List[Token]:
-        return [
-            Token(token, self.language)
-            for token in self.language.tokenizer.tokenize(self.val)
-        ]
+        return list(self.iter_tokens())
+
+    def analyses(self) -> Iterator[TokenAnalysis]:
+        pipeline = self.pipeline or default_pipeline(self.language)
+        return pipeline.analyze(self.val)
+
+    def lines(self, ipa: bool = False, scansion: bool = False) -> Iterator[str]:
+        """
+        Lazily render the document line by line, alternating syllable and scansion
+        lines when `scansion` is set. Only the lines being built are held in memory.
+        """
+        return wrap_lines(self.analyses(), self.max_line_width, ipa, scansion)
+
+    def write(self, sink: IO[str], ipa: bool = False, scansion: bool = False) -> None:
+        """
+        Render the document into a text stream (e.g. an open file) as it is analyzed.
+        """
+        write_lines(sink, self.lines(ipa, scansion))
 
     def to_string(self, ipa: bool = False, scansion: bool = False) -> str:
-        def _create_lines(tokens, func, current_line="", lines=[]):
-            if not tokens:
-                return lines + [current_line]
-            token_str = func(tokens[0])
-            if len(current_line) + len(token_str) + 4 > self.max_line_width:
-                return _create_lines(
-                    tokens[1:], func, token_str, lines + [current_line]
-                )
-            else:
-                new_line = (
-                    current_line + "    " + token_str if current_line else token_str
-                )
-                return _create_lines(tokens[1:], func, new_line, lines)
-
-        join_syllables: Callable[[Token], str] = lambda token: ".".join(
-            map(lambda syl: syl.to_string(ipa), token.syllables)
-        )
-        syllable_lines = _create_lines(self.tokens, join_syllables)
-        if scansion:
-            join_scansion: Callable[[Token], str] = lambda token: " ".join(
-                map(
-                    lambda syl: syl.scansion_str(ipa).center(len(syl.to_string(ipa))),
-                    token.syllables,
-                )
-            )
-            scansion_lines = _create_lines(self.tokens, join_scansion)
-
-            # join syllable_lines and scansion_lines alternatively
-            combined_lines = [
-                val for pair in zip(syllable_lines, scansion_lines) for val in pair
-            ]
-            return "\n".join(combined_lines)
-
-        return "\n".join(syllable_lines)
+        buffer = StringIO()
+        self.write(buffer, ipa, scansion)
+        return buffer.getvalue()
 
     def __repr__(self):
         return self.to_string(ipa=True, scansion=True)
@@ -0,0 +1,178 @@
+import json
+from collections import deque
+from html import escape
+from typing import IO, Deque, Iterable, Iterator, List, Optional
+
+from loquax.abstractions import Syllable
+from loquax.abstractions.pipeline import TokenAnalysis
+
+
+class LineWrapper:
+    """
+    Greedily packs rendered tokens into lines of at most `max_line_width` characters,
+    separating tokens on a line with four spaces.
+    """
+
+    def __init__(self, max_line_width: int):
+        self.max_line_width = max_line_width
+        self.line = ""
+
+    def push(self, token_str: str) -> Optional[str]:
+        """
+        Add a token to the current line, returning the finished line if it had to wrap.
+        """
+        if len(self.line) + len(token_str) + 4 > self.max_line_width:
+            line, self.line = self.line, token_str
+            return line
+        self.line = self.line + "    " + token_str if self.line else token_str
+        return None
+
+    def flush(self) -> str:
+        return self.line
+
+
+def join_syllables(syllables: List[Syllable], ipa: bool) -> str:
+    """
+    Render a token as its syllables separated by dots, e.g. "vi.rum.que".
+    """
+    return ".".join(syl.to_string(ipa) for syl in syllables)
+
+
+def join_scansion(syllables: List[Syllable], ipa: bool) -> str:
+    """
+    Render the quantity of every syllable of a token, centered under the syllable as
+    `join_syllables` renders it.
+    """
+    return " ".join(
+        syl.scansion_str(ipa).center(len(syl.to_string(ipa))) for syl in syllables
+    )
+
+
+def wrap_lines(
+    analyses: Iterable[TokenAnalysis],
+    max_line_width: int = 90,
+    ipa: bool = False,
+    scansion: bool = False,
+) -> Iterator[str]:
+    """
+    Lazily render analyzed tokens line by line, alternating syllable and scansion lines
+    when `scansion` is set. Every token is rendered once, and only the lines being built
+    are held in memory.
+    """
+    syllable_lines = LineWrapper(max_line_width)
+    if not scansion:
+        for analysis in analyses:
+            line = syllable_lines.push(join_syllables(analysis.syllables, ipa))
+            if line is not None:
+                yield line
+        yield syllable_lines.flush()
+        return
+
+    # Both line kinds are wrapped independently and then paired up in order
+    scansion_lines = LineWrapper(max_line_width)
+    pending_syllables: Deque[str] = deque()
+    pending_scansions: Deque[str] = deque()
+    for analysis in analyses:
+        syllables = analysis.syllables
+        line = syllable_lines.push(join_syllables(syllables, ipa))
+        if line is not None:
+            pending_syllables.append(line)
+        line = scansion_lines.push(join_scansion(syllables, ipa))
+        if line is not None:
+            pending_scansions.append(line)
+        while pending_syllables and pending_scansions:
+            yield pending_syllables.popleft()
+            yield pending_scansions.popleft()
+    pending_syllables.append(syllable_lines.flush())
+    pending_scansions.append(scansion_lines.flush())
+    for pair in zip(pending_syllables, pending_scansions):
+        yield from pair
+
+
+def write_lines(sink: IO[str], lines: Iterable[str]) -> None:
+    """
+    Write lines to `sink` separated (not terminated) by newlines, like "\\n".join would.
+    """
+    separator = ""
+    for line in lines:
+        sink.write(separator)
+        sink.write(line)
+        separator = "\n"
+
+
+def render_plain(
+    sink: IO[str], analyses: Iterable[TokenAnalysis], max_line_width: int = 90
+) -> None:
+    """
+    Write the syllabified tokens, wrapped at `max_line_width`, e.g. "ar.ma    vi.rum.que".
+    """
+    write_lines(sink, wrap_lines(analyses, max_line_width))
+
+
+def render_ipa(
+    sink: IO[str], analyses: Iterable[TokenAnalysis], max_line_width: int = 90
+) -> None:
+    """
+    Write the syllabified tokens in IPA, wrapped at `max_line_width`.
+    """
+    write_lines(sink, wrap_lines(analyses, max_line_width, ipa=True))
+
+
+def render_scansion(
+    sink: IO[str],
+    analyses: Iterable[TokenAnalysis],
+    max_line_width: int = 90,
+    ipa: bool = False,
+) -> None:
+    """
+    Write the syllabified tokens, each line followed by the quantities of its syllables.
+    """
+    write_lines(sink, wrap_lines(analyses, max_line_width, ipa, scansion=True))
+
+
+def render_json(
+    sink: IO[str], analyses: Iterable[TokenAnalysis], ipa: bool = False
+) -> None:
+    """
+    Write a JSON array with an object per token, one per line:
+
+        {"token": "arma", "syllables": ["ar", "ma"], "long": [true, false]}
+    """
+    sink.write("[")
+    separator = "\n"
+    for analysis in analyses:
+        sink.write(separator)
+        sink.write(
+            json.dumps(
+                {
+                    "token": analysis.token,
+                    "syllables": [s.to_string(ipa) for s in analysis.syllables],
+                    "long": [s.is_long for s in analysis.syllables],
+                },
+                ensure_ascii=False,
+            )
+        )
+        separator = ",\n"
+    sink.write("\n]" if separator != "\n" else "]")
+
+
+def render_html(
+    sink: IO[str], analyses: Iterable[TokenAnalysis], ipa: bool = False
+) -> None:
+    """
+    Write an HTML fragment with a span per token and per syllable, classed by quantity:
+
+        <span class="token"><span class="syllable long">ar</span>.<span ...
+    """
+    sink.write('<div class="loquax">')
+    for analysis in analyses:
+        sink.write('\n<span class="token">')
+        sink.write(
+            ".".join(
+                f'<span class="syllable {"long" if s.is_long else "short"}">'
+                f"{escape(s.to_string(ipa))}</span>"
+                for s in analysis.syllables
+            )
+        )
+        sink.write("</span>")
+    sink.write("\n</div>")
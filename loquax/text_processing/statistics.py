@@ -0,0 +1,114 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Union
+
+from loquax.abstractions import Language, Syllable
+from loquax.abstractions.pipeline import Pipeline, TokenAnalysis
+from loquax.abstractions.syllabification import default_pipeline
+
+
+def syllable_structure(syllable: Syllable) -> str:
+    """
+    The consonant/vowel shape of a syllable, e.g. "CVC" for "rum" or "CCV" for "trā".
+    """
+    return (
+        "C" * len(syllable.onset)
+        + ("V" if syllable.nucleus else "")
+        + "C" * len(syllable.coda or ())
+    )
+
+
+@dataclass
+class CorpusStatistics:
+    """
+    Counts over the analyzed tokens of a corpus: phoneme frequencies (by symbol),
+    syllable structures, and syllable quantities. Only the counters are kept, so their
+    size depends on the language's inventory rather than on the corpus. Statistics of
+    separate shards merge into those of the whole with `merge` or `+`.
+    """
+
+    tokens: int = 0
+    syllables: int = 0
+    long_syllables: int = 0
+    phonemes: Counter = field(default_factory=Counter)
+    consonants: int = 0
+    vowels: int = 0
+    structures: Counter = field(default_factory=Counter)
+
+    @classmethod
+    def from_text(
+        cls,
+        text: Union[str, Iterable[str]],
+        language: Language,
+        pipeline: Optional[Pipeline] = None,
+    ) -> "CorpusStatistics":
+        """
+        Count over a text, or a stream of text chunks such as an open file.
+        """
+        pipeline = pipeline or default_pipeline(language)
+        return cls().update(pipeline.analyze(text))
+
+    def add(self, analysis: TokenAnalysis) -> None:
+        self.tokens += 1
+        phonemes, structures = self.phonemes, self.structures
+        for syllable in analysis.syllables:
+            self.syllables += 1
+            self.long_syllables += syllable.is_long
+            structures[syllable_structure(syllable)] += 1
+            for phoneme in syllable.phonemes:
+                phonemes[phoneme.val] += 1
+                if phoneme.is_vowel:
+                    self.vowels += 1
+                elif phoneme.is_consonant:
+                    self.consonants += 1
+
+    def update(self, analyses: Iterable[TokenAnalysis]) -> "CorpusStatistics":
+        """
+        Count every analysis of a stream (e.g. `pipeline.analyze(text)`), in place.
+        """
+        for analysis in analyses:
+            self.add(analysis)
+        return self
+
+    def merge(self, other: "CorpusStatistics") -> "CorpusStatistics":
+        """
+        Add the counts of another shard to these, in place.
+        """
+        self.tokens += other.tokens
+        self.syllables += other.syllables
+        self.long_syllables += other.long_syllables
+        self.phonemes.update(other.phonemes)
+        self.consonants += other.consonants
+        self.vowels += other.vowels
+        self.structures.update(other.structures)
+        return self
+
+    def __add__(self, other: "CorpusStatistics") -> "CorpusStatistics":
+        return CorpusStatistics().merge(self).merge(other)
+
+    @property
+    def short_syllables(self) -> int:
+        return self.syllables - self.long_syllables
+
+    @property
+    def long_ratio(self) -> float:
+        """
+        The share of long syllables, or 0.0 for an empty corpus.
+        """
+        return self.long_syllables / self.syllables if self.syllables else 0.0
+
+    def phoneme_frequencies(self) -> Dict[str, float]:
+        """
+        The relative frequency of each phoneme, most frequent first.
+        """
+        total = sum(self.phonemes.values())
+        return {val: n / total for val, n in self.phonemes.most_common()}
+
+    def structure_distribution(self) -> Dict[str, float]:
+        """
+        The share of syllables with each structure, most frequent first.
+        """
+        return {
+            structure: n / self.syllables
+            for structure, n in self.structures.most_common()
+        }
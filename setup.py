@@ -1,11 +1,17 @@
+import re
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# The version is kept in loquax/__init__.py, where analysis caches read it
+with open("loquax/__init__.py", "r", encoding="utf-8") as fh:
+    version = re.search(r'^__version__ = "([^"]+)"', fh.read(), re.M).group(1)
+
 setup(
     name="loquax",
-    version="0.1.5",
+    version=version,
     author="Matthieu Court",
     author_email="matthieu.court@protonmail.com",
     description="A Classical Phonology framework",
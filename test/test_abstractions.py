@@ -1,7 +1,17 @@
 import pytest
 
 from loquax.languages import Latin
+from loquax.abstractions import Phoneme
 from loquax.abstractions.phonology import get_phonemes
+from loquax.abstractions.trie import SymbolTrie
+from loquax.abstractions.constants import (
+    VOWEL,
+    CONSONANT,
+    STOP,
+    LIQUID,
+    ASPIRATE,
+    DIPHTHONG,
+)
 
 
 @pytest.fixture
@@ -33,3 +43,48 @@ def test_get_ipa_from_phonemes(lang):
     word = "dominorum"
     expected = ["d", "ɔ", "m", "ɪ", "n", "ɔ", "r", "ʊ", "m"]
     assert [phoneme.ipa for phoneme in get_phonemes(word, lang)] == expected
+
+
+def test_feature_table(lang):
+    features = lang.constants.features
+    assert features["ph"] & ASPIRATE and features["ph"] & CONSONANT
+    assert features["ae"] & VOWEL and features["ae"] & DIPHTHONG
+    assert features["t"] & STOP and not features["t"] & LIQUID
+    assert "ß" not in features
+    assert lang.constants.vowels is lang.constants.vowels
+
+
+def test_phonemes_are_interned(lang):
+    first, second = get_phonemes("rosa", lang), get_phonemes("rosae", lang)
+    assert first[0] is second[0] is lang.phoneme("r")
+    assert lang.phoneme("l", "ɫ") is lang.phoneme("l").set_ipa("ɫ")
+    assert lang.phoneme("l", "ɫ") == Phoneme("l", lang, "ɫ")
+    assert hash(lang.phoneme("s")) == hash(Phoneme("s", lang))
+
+
+def test_phoneme_validation(lang):
+    with pytest.raises(ValueError):
+        lang.phoneme("w")
+    with pytest.raises(ValueError):
+        Phoneme("l", lang, "ʃ")
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("abcab", ["abc", "ab"]),
+        ("abd", ["ab", "d"]),
+        ("xabx", ["x", "ab", "x"]),
+        ("ac", ["a", "c"]),
+        ("", []),
+    ],
+)
+def test_symbol_trie_longest_match(text, expected):
+    assert SymbolTrie({"ab", "abc"}).segment(text) == expected
+
+
+def test_split_long_token(lang):
+    word = "quaeph" * 2000
+    result = get_phonemes(word, lang)
+    assert [str(phoneme) for phoneme in result[:3]] == ["qu", "ae", "ph"]
+    assert len(result) == 6000
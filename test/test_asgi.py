@@ -0,0 +1,121 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "webapp"))
+
+import asgi  # noqa: E402
+from response_cache import MemoryBackend, ResponseCache  # noqa: E402
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = asgi.RenderPool(workers=1, queue_limit=2)
+    monkeypatch.setattr(asgi, "_pool", pool)
+    monkeypatch.setattr(asgi, "responses", ResponseCache([MemoryBackend()]))
+    yield pool
+    pool.shutdown()
+
+
+def call(method, path, data=None, headers=()):
+    """
+    Drive the ASGI app with one request, returning the status, the headers and the
+    body of the response.
+    """
+    body = b"" if data is None else data.encode("utf-8")
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "headers": list(headers)}
+    asyncio.run(asgi.app(scope, receive, send))
+    start, *bodies = sent
+    assert bodies[-1].get("more_body", False) is False
+    return (
+        start["status"],
+        dict(start["headers"]),
+        b"".join(message.get("body", b"") for message in bodies),
+    )
+
+
+def records(body):
+    return [json.loads(line) for line in body.decode("utf-8").splitlines()]
+
+
+def test_translate_and_etag(pool):
+    status, headers, body = call("POST", "/loquax", '{"text": "arma virumque"}')
+    assert status == 200
+    assert json.loads(body) == {"translation": "ar.ma    vi.rum.que"}
+    etag = headers[b"etag"]
+    location = headers[b"content-location"].decode("latin-1")
+    assert location == "/loquax/translations/" + etag.decode("latin-1").strip('"')
+
+    # Conditional requests are only answered on the GET resource
+    for tag in [etag, b"*"]:
+        status, _, _ = call(
+            "POST", "/loquax", '{"text": "arma virumque"}', [(b"if-none-match", tag)]
+        )
+        assert status == 200
+    status, headers, body = call("GET", location)
+    assert status == 200
+    assert json.loads(body) == {"translation": "ar.ma    vi.rum.que"}
+    assert headers[b"etag"] == etag
+    status, _, body = call("GET", location, headers=[(b"if-none-match", etag)])
+    assert (status, body) == (304, b"")
+
+
+@pytest.mark.parametrize("key", ["0" * 64, "..", "0123"])
+def test_unknown_translation(pool, key):
+    status, _, body = call("GET", f"/loquax/translations/{key}")
+    assert status == 404
+    assert "error" in json.loads(body)
+
+
+@pytest.mark.parametrize("path", ["/loquax", "/batch"])
+def test_busy(pool, path):
+    pool.pending = pool.capacity
+    status, headers, body = call("POST", path, '{"text": "arma"}')
+    assert status == 503
+    assert headers[b"retry-after"] == b"1"
+    assert "error" in json.loads(body)
+
+
+def test_batch(pool):
+    status, headers, body = call("POST", "/batch", '{"texts": ["arma", "canō"]}')
+    assert status == 200
+    assert headers[b"content-type"] == b"application/x-ndjson"
+    assert records(body) == [
+        {"index": 0, "line": "ar.ma"},
+        {"index": 0, "done": True},
+        {"index": 1, "line": "ca.nō"},
+        {"index": 1, "done": True},
+    ]
+
+
+@pytest.mark.parametrize(
+    "data", ['{"texts": "ab"}', '{"texts": ["a", 1]}', '{"text": 1}', "null", "[1]"]
+)
+def test_batch_rejects_bad_input(pool, data):
+    status, _, body = call("POST", "/batch", data)
+    assert status == 400
+    assert "error" in json.loads(body)
+
+
+def test_unanalyzable_text(pool):
+    status, _, body = call("POST", "/loquax", '{"text": "wow"}')
+    assert status == 400
+    assert "error" in json.loads(body)
+
+    status, _, body = call("POST", "/batch", '{"texts": ["wow", "arma"]}')
+    lines = records(body)
+    assert status == 200
+    assert lines[0]["index"] == 0 and "error" in lines[0]
+    assert lines[1:] == [{"index": 1, "line": "ar.ma"}, {"index": 1, "done": True}]
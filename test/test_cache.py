@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from loquax.abstractions import LRUCache, MorphismStore
+from loquax.abstractions.syllabification import get_syllables_from_token
+from loquax.languages import Latin
+
+
+@pytest.fixture
+def lang():
+    Latin.analysis_cache.clear()
+    yield Latin
+    Latin.analysis_cache.clear()
+
+
+def test_lru_eviction_order():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_lru_counters_and_clear():
+    cache = LRUCache(maxsize=4)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    info = cache.info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 1, 4, 1)
+    cache.clear()
+    assert cache.info().currsize == 0 and cache.info().hits == 0
+
+
+def test_lru_resize():
+    cache = LRUCache(maxsize=3)
+    for key in "abc":
+        cache.put(key, key)
+    cache.resize(1)
+    assert len(cache) == 1 and "c" in cache
+    cache.resize(0)
+    cache.put("d", "d")
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        cache.resize(-1)
+
+
+def test_syllables_are_cached_per_word_form(lang):
+    first = get_syllables_from_token("dominōrum", lang)
+    second = get_syllables_from_token("dominōrum", lang)
+    assert first == second and first is not second
+    info = lang.analysis_cache.info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_cache_under_threads(lang):
+    maxsize = lang.analysis_cache.maxsize
+    lang.analysis_cache.resize(4)
+    try:
+        words = ["arma", "virumque", "canō", "trōiae", "quī", "prīmus", "ab", "ōrīs"]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda w: str(get_syllables_from_token(w, lang)), words * 50)
+            )
+        assert results == [str(get_syllables_from_token(w, lang)) for w in words * 50]
+        assert len(lang.analysis_cache) <= 4
+    finally:
+        lang.analysis_cache.resize(maxsize)
+
+
+def test_derived_languages_have_their_own_cache(lang):
+    syllables = get_syllables_from_token("nostrā", lang)
+    assert [s.is_long for s in syllables] == [False, True]
+    derived = replace(lang, syllable_morphisms=MorphismStore([]))
+    assert derived.analysis_cache is not lang.analysis_cache
+    syllables = get_syllables_from_token("nostrā", derived)
+    assert [s.is_long for s in syllables] == [False, False]
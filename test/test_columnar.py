@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+
+from loquax.abstractions import columnar
+from loquax.abstractions.columnar import ColumnarCorpus, PhonemeCodec
+from loquax.abstractions.syllabification import get_syllables_from_token
+from loquax.languages import Latin
+
+SAMPLE = Path(__file__).parent.parent / "benchmarks" / "corpus" / "latin_sample.txt"
+
+
+@pytest.fixture
+def lang():
+    return Latin
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        if columnar.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(columnar, "np", None)
+    return request.param
+
+
+def describe(syllables):
+    return [(s.val, s.is_long, [p.ipa for p in s.phonemes]) for s in syllables]
+
+
+def test_codec_round_trip(lang):
+    codec = PhonemeCodec(lang)
+    phonemes = [lang.phoneme("qu"), lang.phoneme("ae"), lang.phoneme("v", "w")]
+    assert codec.decode(codec.encode(phonemes)) == phonemes
+    assert codec.typecode == "B"
+
+
+@pytest.mark.usefixtures("backend")
+def test_matches_object_syllabification(lang):
+    tokens = lang.tokenizer.tokenize(SAMPLE.read_text(encoding="utf-8"))
+    tokens += ["", "strc", "ae", "arma", "virumque"]
+    corpus = ColumnarCorpus.encode(tokens, lang)
+
+    assert len(corpus) == len(tokens)
+    for i, token in enumerate(tokens):
+        assert describe(corpus.syllables(i)) == describe(
+            get_syllables_from_token(token, lang)
+        ), token
+
+
+@pytest.mark.usefixtures("backend")
+def test_syllable_spans(lang):
+    corpus = ColumnarCorpus.encode(["arma", "virum", "st"], lang)
+    assert list(corpus.syllable_offsets) == [0, 2, 4, 5]
+    assert list(corpus.syllable_starts) == [0, 2, 4, 6, 9]
+    assert list(corpus.syllable_ends) == [2, 4, 6, 9, 11]
+    assert [s.val for s in corpus.syllables(1)] == ["vi", "rum"]
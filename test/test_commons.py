@@ -1,7 +1,21 @@
 import pytest
 
 from loquax.abstractions import Phoneme
-from loquax.text_processing.commons import has_macron
+from loquax.abstractions.constants import (
+    ACUTE,
+    GRAVE,
+    MACRON,
+    TILDE,
+    TREMA,
+    diacritic_flags,
+)
+from loquax.text_processing.commons import (
+    has_acute,
+    has_grave,
+    has_macron,
+    has_tilde,
+    has_trema,
+)
 from loquax.languages import Latin
 
 
@@ -14,3 +28,19 @@ from loquax.languages import Latin
 )
 def test_macron(phoneme_input, expected_output):
     assert has_macron(phoneme_input) is expected_output
+
+
+def test_accents():
+    assert [
+        f(Phoneme(symbol, Latin))
+        for symbol in ("ā", "a")
+        for f in (has_macron, has_trema, has_acute, has_grave, has_tilde)
+    ] == [True, False, False, False, False] + [False] * 5
+
+
+def test_diacritic_table():
+    diacritics = Latin.constants.diacritics
+    assert diacritics["ū"] == MACRON
+    assert diacritics["ae"] == 0
+    assert diacritic_flags("ëó") == TREMA | ACUTE
+    assert diacritic_flags("ãè") == TILDE | GRAVE
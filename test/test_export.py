@@ -0,0 +1,70 @@
+import io
+
+import pytest
+
+from loquax.abstractions.syllabification import default_pipeline
+from loquax.languages import Latin
+from loquax.text_processing.export import (
+    ColumnarReader,
+    read_jsonl,
+    write_columnar,
+    write_jsonl,
+)
+
+TEXT = "Arma virumque canō, Trōiae quī prīmus ab ōrīs Ītaliam fātō profugus"
+
+
+@pytest.fixture
+def analyses():
+    return list(default_pipeline(Latin).analyze(TEXT))
+
+
+def describe(analyses):
+    return [
+        (
+            a.token,
+            a.phonemes,
+            [(s, s.is_long, s.to_string(ipa=True)) for s in a.syllables],
+        )
+        for a in analyses
+    ]
+
+
+def test_columnar_round_trip(tmp_path, analyses):
+    path = str(tmp_path / "corpus.lqx")
+    assert write_columnar(path, analyses, Latin) == len(analyses)
+
+    with ColumnarReader(path) as corpus:
+        assert corpus.language is Latin
+        assert len(corpus) == len(analyses)
+        assert describe(corpus) == describe(analyses)
+        assert corpus.token(2) == "canō"
+        assert list(corpus.syllable_long) == [
+            s.is_long for a in analyses for s in a.syllables
+        ]
+        assert corpus.syllables(0)[0] is corpus.syllables(0)[0]
+
+
+def test_columnar_empty_corpus(tmp_path):
+    path = str(tmp_path / "empty.lqx")
+    write_columnar(path, [], Latin)
+    with ColumnarReader(path) as corpus:
+        assert len(corpus) == 0
+        assert list(corpus) == []
+
+
+def test_columnar_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a corpus at all")
+    with pytest.raises(ValueError):
+        ColumnarReader(str(path))
+
+
+def test_jsonl_round_trip(analyses):
+    buffer = io.StringIO()
+    assert write_jsonl(buffer, analyses) == len(analyses)
+    lines = buffer.getvalue().splitlines()
+    assert lines[0].startswith('{"token": "arma", "syllables": [{"val": "ar"')
+
+    buffer.seek(0)
+    assert describe(read_jsonl(buffer, "lat")) == describe(analyses)
@@ -0,0 +1,69 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from loquax import Document
+from loquax.abstractions import TokenSpan
+from loquax.languages import Latin
+from loquax.text_processing import EditableDocument
+
+SAMPLE = Path(__file__).parent.parent / "benchmarks" / "corpus" / "latin_sample.txt"
+MODES = [(False, False), (True, False), (False, True), (True, True)]
+
+
+@pytest.fixture
+def lang():
+    return Latin
+
+
+def assert_matches_document(doc, lang):
+    expected = Document(doc.text, lang, doc.max_line_width)
+    for ipa, scansion in MODES:
+        assert doc.lines(ipa, scansion) == list(expected.lines(ipa, scansion))
+    assert doc.spans == list(lang.tokenizer.tokenize_spans(doc.text))
+
+
+def test_edit_within_word(lang):
+    doc = EditableDocument("arma virumque cano", lang, 20)
+    doc.edit(5, 10, "")
+    assert doc.text == "arma que cano"
+    assert doc.spans[1] == TokenSpan("que", 5, 8)
+    assert_matches_document(doc, lang)
+
+
+def test_edit_reanalyzes_only_changed_tokens(lang):
+    doc = EditableDocument("arma virumque cano", lang)
+    untouched = doc.analyses[2]
+    doc.edit(0, 4, "Troiae qui")
+    assert [a.token for a in doc.analyses] == ["troiae", "qui", "virumque", "cano"]
+    assert doc.analyses[3] is untouched
+
+
+def test_failed_edit_leaves_document_unchanged(lang):
+    doc = EditableDocument("arma virumque", lang)
+    with pytest.raises(ValueError):
+        doc.edit(5, 13, "w")
+    with pytest.raises(ValueError):
+        doc.edit(4, 2, "")
+    assert doc.text == "arma virumque"
+    assert_matches_document(doc, lang)
+
+
+@pytest.mark.parametrize("max_line_width", [10, 40, 90])
+def test_random_edits(lang, max_line_width):
+    rng = random.Random(max_line_width)
+    replacements = ["", " ", "\n", "arma", " virumque ", "ā", ",", "xx", "1"]
+    doc = EditableDocument(
+        SAMPLE.read_text(encoding="utf-8")[:800], lang, max_line_width
+    )
+    for ipa, scansion in MODES:
+        doc.lines(ipa, scansion)
+    for _ in range(40):
+        start = rng.randint(0, len(doc.text))
+        end = min(len(doc.text), start + rng.choice([0, 1, 5, 30]))
+        try:
+            doc.edit(start, end, rng.choice(replacements))
+        except ValueError:
+            continue
+        assert_matches_document(doc, lang)
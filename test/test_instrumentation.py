@@ -0,0 +1,73 @@
+import pytest
+
+from loquax import Document
+from loquax.abstractions import instrumentation
+from loquax.abstractions.instrumentation import Stats, profile
+from loquax.languages import Latin
+from loquax.languages.latin_conf.rules import (
+    latin_syllabification_rules,
+    latin_syllable_morphisms,
+)
+
+
+@pytest.fixture
+def lang():
+    Latin.analysis_cache.clear()
+    yield Latin
+    Latin.analysis_cache.clear()
+
+
+def test_disabled_by_default():
+    assert instrumentation.active() is None
+
+
+def test_profile_records_stages_morphisms_and_rules(lang):
+    with profile() as stats:
+        Document("nostrā nostrā patrem", lang).to_string()
+    assert instrumentation.active() is None
+
+    assert stats.stages["tokenize"].calls == 1
+    assert stats.stages["segment"].calls == 2
+    assert stats.stages["syllable_morphisms"].calls == 2
+
+    morphisms = {
+        m.index: m
+        for m in stats.morphisms.values()
+        if m.store is latin_syllable_morphisms
+    }
+    assert len(morphisms) == 6
+    assert morphisms[0].morphism is latin_syllable_morphisms.morphisms[0]
+    # nos.trā and pa.trem: trā is long by nature, pa is not long by position
+    assert morphisms[0].hits == 1 and morphisms[0].evaluations == 4
+
+    fired = {
+        r.index: r.fired
+        for r in stats.rule_sequences.values()
+        if r.store is latin_syllabification_rules
+    }
+    # "str" and "tr" split as stop + liquid on both sides, the final "m" is a consonant
+    assert fired == {0: 4, 2: 1}
+
+
+def test_profile_records_streamed_input(lang):
+    with profile() as stats:
+        Document(iter(["nostrā nos", "trā\npatrem"]), lang).to_string()
+
+    assert stats.stages["tokenize"].calls == 1
+    assert stats.stages["tokenize"].seconds > 0
+    assert stats.stages["segment"].calls == 2
+
+
+def test_enable_and_disable():
+    stats = instrumentation.enable()
+    try:
+        assert instrumentation.active() is stats
+    finally:
+        assert instrumentation.disable() is stats
+    assert instrumentation.active() is None
+
+
+def test_summary_lines(lang):
+    with profile(Stats()) as stats:
+        Document("arma virumque", lang).to_string()
+    assert any(line.startswith("stage segment: 2 calls") for line in stats.summary())
@@ -0,0 +1,87 @@
+import subprocess
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+import loquax.languages as languages
+from loquax.languages import Latin, available_languages, get_language, register_language
+
+# Cumulative import time of loquax.languages, in microseconds. It builds no language,
+# so it should stay far below this even on a slow machine.
+IMPORT_BUDGET_US = 100_000
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(languages, "_languages", dict(languages._languages))
+    monkeypatch.setattr(languages, "_factories", dict(languages._factories))
+    monkeypatch.setattr(languages, "_entry_points_loaded", False)
+
+
+class FakeEntryPoint:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self.value
+
+
+def test_get_language():
+    assert get_language("lat") is Latin
+    assert "lat" in available_languages()
+    with pytest.raises(ValueError):
+        get_language("xxx")
+
+
+def test_register_language_builds_lazily():
+    built = []
+
+    def build():
+        built.append(1)
+        return replace(Latin, iso_639_code="la-x")
+
+    register_language("la-x", build)
+    assert built == []
+    assert "la-x" in available_languages()
+    assert get_language("la-x") is get_language("la-x")
+    assert built == [1]
+
+
+def test_entry_points(monkeypatch):
+    entry_point = FakeEntryPoint("la-y", lambda: replace(Latin, iso_639_code="la-y"))
+    monkeypatch.setattr(
+        "importlib.metadata.entry_points",
+        lambda group: [entry_point] if group == languages.ENTRY_POINT_GROUP else [],
+    )
+    assert entry_point.loads == 0
+    assert get_language("la-y").iso_639_code == "la-y"
+    assert get_language("la-y") is get_language("la-y")
+    assert entry_point.loads == 1
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, loquax.languages\n"
+        "print(any(m.startswith(('loquax.languages.latin', 'loquax.text_processing'))"
+        " for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+    (line,) = [
+        line
+        for line in result.stderr.splitlines()
+        if line.endswith("| loquax.languages")
+    ]
+    cumulative = int(line.split("|")[1])
+    assert cumulative < IMPORT_BUDGET_US
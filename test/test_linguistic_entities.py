@@ -1,3 +1,7 @@
+import random
+from dataclasses import FrozenInstanceError, replace
+from functools import reduce
+
 import pytest
 
 from loquax.languages import Latin
@@ -109,6 +113,53 @@ class TestMorphism:
         expected = [phonemes["a"], phonemes["a"], phonemes["c"]]
         assert result == expected
 
+    def test_compiled_rules(self, phonemes):
+        a, b, c = phonemes["a"], phonemes["b"], phonemes["c"]
+        assert Rule[Phoneme](val="a").matches(a)
+        assert Rule[Phoneme](val={"a", "b"}).matches(b)
+        assert not Rule[Phoneme](val={"a", "b"}).matches(c)
+        assert Rule[Phoneme](wildcard=True, val="z").matches(c)
+
+        sequence = RuleSequence[Phoneme](
+            [
+                Rule[Phoneme](val="a"),
+                Rule[Phoneme](wildcard=True),
+                Rule[Phoneme](val="c"),
+            ]
+        )
+        assert [offset for offset, _ in sequence.checks] == [0, 2]
+        assert sequence.matches([b, a, b, c])
+        assert sequence.matches_at([a, b, c, b], 0)
+        assert not sequence.matches_at([a, b, c, b], 1)
+        assert not sequence.matches([b, c])
+
+    def test_fused_store_matches_sequential_application(self, phonemes):
+        rng = random.Random(7)
+        symbols = "abcd"
+
+        def random_sequence(length):
+            return RuleSequence[Phoneme](
+                [Rule[Phoneme](val=rng.choice(symbols)) for _ in range(length)]
+            )
+
+        for _ in range(200):
+            morphisms = [
+                Morphism[Phoneme](
+                    target=Rule[Phoneme](val=rng.choice(symbols)),
+                    transformation=phonemes[rng.choice(symbols)],
+                    prefix=random_sequence(rng.randint(0, 2))
+                    if rng.random() < 0.7
+                    else None,
+                    suffix=random_sequence(rng.randint(0, 2))
+                    if rng.random() < 0.7
+                    else None,
+                )
+                for _ in range(rng.randint(1, 5))
+            ]
+            seq = [phonemes[rng.choice(symbols)] for _ in range(rng.randint(0, 12))]
+            expected = reduce(lambda units, m: m.apply(units), morphisms, seq)
+            assert MorphismStore(morphisms).apply_all(seq) == expected
+
 
 @pytest.mark.usefixtures("lang", "rule_store")
 @pytest.mark.syllabification
@@ -155,6 +206,16 @@ class TestSyllabification:
         assert syllable.nucleus == None
         assert syllable.coda == None
 
+    def test_with_length(self, lang):
+        syllable = Syllable([Phoneme("qu", lang), Phoneme("ae", lang)], lang)
+        long_syllable = syllable.with_length(True)
+        assert long_syllable == replace(syllable, is_long=True)
+        assert long_syllable.is_long and not syllable.is_long
+        assert long_syllable.nucleus == [Phoneme("ae", lang)]
+        assert long_syllable.to_string(ipa=True) == "kʷae̯"
+        with pytest.raises(FrozenInstanceError):
+            syllable.is_long = True
+
     '''
     test syllable rule store
     '''
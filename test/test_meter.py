@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+
+from loquax.abstractions.syllabification import default_pipeline
+from loquax.languages import Latin
+from loquax.text_processing.meter import (
+    HEXAMETER,
+    PENTAMETER,
+    SCAN_CACHE_SIZE,
+    Meter,
+    line_syllables,
+    scan_line,
+    scan_lines,
+)
+
+SAMPLE = Path(__file__).parent.parent / "benchmarks" / "corpus" / "latin_sample.txt"
+
+
+@pytest.fixture
+def lang():
+    return Latin
+
+
+def test_scan_hexameter(lang):
+    scansion = scan_line("Arma virumque canō, Trōiae quī prīmus ab ōrīs", lang)
+    assert scansion.scannable
+    assert scansion.pattern == "-uu|-uu|--|--|-uu|--"
+    assert scansion.to_string() == (
+        "ar.ma.vi | rum.que.ca | nō.trō | jae.quī | prī.mus.ab | ō.rīs"
+    )
+    assert [foot.name for foot in scansion.feet] == [
+        "dactyl",
+        "dactyl",
+        "spondee",
+        "spondee",
+        "dactyl",
+        "spondee",
+    ]
+    assert all(
+        syllable.is_long == (mark == "-")
+        for syllable, mark in zip(scansion.syllables, scansion.pattern.replace("|", ""))
+    )
+
+
+def test_elision(lang):
+    line = "multa quoque et bellō passus, dum conderet urbem,"
+    scansion = scan_line(line, lang)
+    assert scansion.pattern == "-uu|--|--|--|-uu|-u"
+    assert "que" not in [s.val for s in scansion.syllables]
+
+    unelided = scan_line(line, lang, elision=False)
+    assert "que" in [s.val for s in unelided.syllables]
+
+
+def test_scan_pentameter(lang):
+    scansion = scan_line("nīl mihi rescrībās ut tamen; ipse venī", lang, PENTAMETER)
+    assert scansion.pattern == "-uu|--|-|-uu|-uu|-"
+
+
+def test_unscannable(lang):
+    scansion = scan_line("arma virumque", lang)
+    assert not scansion.scannable
+    assert scansion.feet == []
+    assert scansion.pattern == "".join(
+        "-" if s.is_long else "u" for s in scansion.syllables
+    )
+
+
+def test_divide_memoized():
+    meter = Meter("test", (("-uu", "--"),) * 2)
+    assert meter.divide("-uu--") == ("-uu", "--")
+    assert meter.divide("uu--") == ("--", "--")
+    assert meter.divide("-u-") is None
+    assert meter.divide("-uu--") is meter.divide("-uu--")
+
+
+def test_divide_cache_is_bounded():
+    meter = Meter("test", (("-uu", "--", "-u"),) * 8)
+    for n in range(SCAN_CACHE_SIZE + 10):
+        meter.divide(format(n, "b").replace("1", "-").replace("0", "u"))
+    assert len(meter._scans) == SCAN_CACHE_SIZE
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [("trōia", ["trō", "ja"]), ("troiia", ["tro", "ja"]), ("maiia", ["ma", "ja"])],
+)
+def test_consonantal_i(lang, word, expected):
+    words = [list(a.syllables) for a in default_pipeline(lang).analyze(word)]
+    syllables = line_syllables(words)
+    assert [s.to_string() for s in syllables] == expected
+    assert [s.is_long for s in syllables] == [True, False]
+
+
+def test_scan_aeneid(lang):
+    lines = SAMPLE.read_text(encoding="utf-8").split("\n\n")[0].splitlines()
+    scansions = list(scan_lines(lines, lang, HEXAMETER))
+    assert len(scansions) == 33
+    assert sum(scansion.scannable for scansion in scansions) >= 30
+    for scansion in scansions:
+        if scansion.scannable:
+            assert len(scansion.feet) == 6
@@ -0,0 +1,35 @@
+import pytest
+
+from loquax import Document
+from loquax.languages import Latin
+from loquax.text_processing.parallel import analyze_corpus, map_ordered
+
+
+@pytest.fixture
+def corpus():
+    lines = [
+        "Arma virumque canō, Trōiae quī prīmus ab ōrīs",
+        "Ītaliam, fātō profugus, Lāvīniaque vēnit",
+        "lītora, multum ille et terrīs iactātus et altō",
+        "vī superum saevae memorem Iūnōnis ob īram;",
+    ]
+    return lines * 10
+
+
+def test_analyze_corpus_matches_serial(corpus):
+    expected = [Document(text, Latin, 60).to_string(scansion=True) for text in corpus]
+    results = analyze_corpus(
+        corpus, "lat", scansion=True, max_line_width=60, processes=2, chunksize=3
+    )
+    assert list(results) == expected
+
+
+def test_map_ordered_streams_in_order():
+    assert list(map_ordered(abs, range(0, -100, -1), processes=2, chunksize=7)) == list(
+        range(100)
+    )
+
+
+def test_unknown_language_is_rejected(corpus):
+    with pytest.raises(ValueError):
+        analyze_corpus(corpus, "grc")
@@ -0,0 +1,97 @@
+from collections import Counter
+from dataclasses import replace
+
+import pytest
+
+from loquax import Document
+from loquax.abstractions import LRUCache, MorphismStore, Pipeline, Stage
+from loquax.abstractions.syllabification import (
+    DEFAULT_STAGES,
+    SYLLABIFY,
+    default_pipeline,
+    get_syllables_from_token,
+)
+from loquax.languages import Latin
+
+
+@pytest.fixture
+def lang():
+    return Latin
+
+
+def counting(stages, calls):
+    def wrap(stage):
+        def apply(analysis, lang):
+            calls[stage.name] += 1
+            return stage.apply(analysis, lang)
+
+        return Stage(stage.name, apply)
+
+    return tuple(wrap(stage) for stage in stages)
+
+
+def test_default_stage_order(lang):
+    assert default_pipeline(lang).stage_names == [
+        "normalize",
+        "segment",
+        "phoneme_morphisms",
+        "syllabify",
+        "syllable_morphisms",
+    ]
+
+
+def test_each_stage_runs_once_per_token(lang):
+    calls = Counter()
+    pipeline = Pipeline(lang, counting(DEFAULT_STAGES, calls))
+    analyses = list(pipeline.analyze("Catilīna patientiā nostrā"))
+    assert [a.token for a in analyses] == ["catilīna", "patientiā", "nostrā"]
+    assert set(calls.values()) == {3}
+    assert len(calls) == len(DEFAULT_STAGES)
+    assert [str(p) for p in analyses[2].phonemes] == ["n", "o", "s", "t", "r", "ā"]
+    assert [s.is_long for s in analyses[2].syllables] == [False, True]
+
+
+def test_pipeline_matches_get_syllables_from_token(lang):
+    for token in ["suprā", "amāvissem", "aquila", ""]:
+        analysis = default_pipeline(lang).run(token)
+        assert analysis.syllables == get_syllables_from_token(token, lang)
+
+
+def test_normalize_stage(lang):
+    decomposed = "su\u0070ra\u0304"
+    analysis = default_pipeline(lang).run(decomposed)
+    assert analysis.token == "suprā"
+    assert analysis.syllables == get_syllables_from_token("suprā", lang)
+
+
+def test_cached_analyses_are_reused(lang):
+    calls = Counter()
+    pipeline = Pipeline(lang, counting(DEFAULT_STAGES, calls), cache=LRUCache())
+    list(pipeline.analyze("arma arma arma"))
+    assert calls["syllabify"] == 1
+
+
+def test_derived_language_documents_are_analyzed_afresh(lang):
+    assert Document("nostrā", lang).to_string(scansion=True) == "nos.trā\n u   - "
+    derived = replace(lang, syllable_morphisms=MorphismStore([]))
+    assert default_pipeline(derived).cache is not default_pipeline(lang).cache
+    assert Document("nostrā", derived).to_string(scansion=True) == "nos.trā\n u   u "
+
+
+def test_skipping_stages(lang):
+    pipeline = default_pipeline(lang).without("syllable_morphisms")
+    assert pipeline.cache is None
+    assert not any(s.is_long for s in pipeline.run("nostrā").syllables)
+    doc = Document("nostrā", lang, pipeline=pipeline)
+    assert doc.to_string(scansion=True) == "nos.trā\n u   u "
+    with pytest.raises(ValueError):
+        pipeline.without("render")
+
+
+def test_replacing_stages(lang):
+    calls = Counter()
+    (syllabify,) = counting([SYLLABIFY], calls)
+    pipeline = default_pipeline(lang).replace_stage("syllabify", syllabify)
+    assert pipeline.stages[3] is syllabify
+    assert pipeline.run("patrem").syllables == get_syllables_from_token("patrem", lang)
+    assert calls["syllabify"] == 1
@@ -0,0 +1,84 @@
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from loquax import Document
+from loquax.abstractions.syllabification import default_pipeline
+from loquax.languages import Latin
+from loquax.text_processing import Token
+from loquax.text_processing.render import (
+    render_html,
+    render_ipa,
+    render_json,
+    render_plain,
+    render_scansion,
+)
+
+SAMPLE = Path(__file__).parent.parent / "benchmarks" / "corpus" / "latin_sample.txt"
+
+
+@pytest.fixture
+def lang():
+    return Latin
+
+
+@pytest.fixture
+def text():
+    return SAMPLE.read_text(encoding="utf-8")[:3000]
+
+
+def render(renderer, lang, text, **kwargs):
+    sink = StringIO()
+    renderer(sink, default_pipeline(lang).analyze(text), **kwargs)
+    return sink.getvalue()
+
+
+def test_text_renderers_match_document(lang, text):
+    doc = Document(text, lang, 75)
+    assert render(render_plain, lang, text, max_line_width=75) == doc.to_string()
+    assert render(render_ipa, lang, text, max_line_width=75) == doc.to_string(ipa=True)
+    assert render(render_scansion, lang, text, max_line_width=75) == doc.to_string(
+        scansion=True
+    )
+    assert render(
+        render_scansion, lang, text, max_line_width=75, ipa=True
+    ) == doc.to_string(ipa=True, scansion=True)
+
+
+def test_document_write(lang, text, tmp_path):
+    path = tmp_path / "aeneid.txt"
+    with open(path, "w", encoding="utf-8") as sink:
+        Document(text, lang).write(sink, scansion=True)
+    assert path.read_text(encoding="utf-8") == Document(text, lang).to_string(
+        scansion=True
+    )
+
+
+def test_token_to_string(lang):
+    token = Token("virumque", lang)
+    assert token.to_string() == "vi.rum.que"
+    assert token.to_string(scansion=True) == "vi.rum.que\nu   u   u "
+    assert token.to_string(ipa=True) == "wɪ.rʊm.kʷɛ"
+
+
+def test_render_json(lang):
+    tokens = json.loads(render(render_json, lang, "Arma virumque"))
+    assert tokens[0] == {
+        "token": "arma",
+        "syllables": ["ar", "ma"],
+        "long": [False, False],
+    }
+    assert tokens[1]["syllables"] == ["vi", "rum", "que"]
+    assert json.loads(render(render_json, lang, "")) == []
+
+
+def test_render_html(lang):
+    html = render(render_html, lang, "canō")
+    assert html == (
+        '<div class="loquax">\n<span class="token">'
+        '<span class="syllable short">ca</span>.'
+        '<span class="syllable long">nō</span>'
+        "</span>\n</div>"
+    )
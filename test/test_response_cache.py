@@ -0,0 +1,131 @@
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "webapp"))
+
+from response_cache import (  # noqa: E402
+    DiskBackend,
+    MemoryBackend,
+    ResponseCache,
+    cache_key,
+    is_cache_key,
+)
+
+
+def test_cache_key():
+    key = cache_key("arma", False, True, 75, "lat:dev:abc")
+    assert key == cache_key("arma", False, True, 75, "lat:dev:abc")
+    assert len(key) == 64
+    variants = [
+        cache_key("arma ", False, True, 75, "lat:dev:abc"),
+        cache_key("arma", True, True, 75, "lat:dev:abc"),
+        cache_key("arma", False, False, 75, "lat:dev:abc"),
+        cache_key("arma", False, True, 90, "lat:dev:abc"),
+        cache_key("arma", False, True, 75, "lat:dev:abd"),
+    ]
+    assert key not in variants and len(set(variants)) == len(variants)
+    assert is_cache_key(key)
+    assert not is_cache_key("..") and not is_cache_key(key.upper())
+
+
+def test_memory_backend_evicts():
+    backend = MemoryBackend(2)
+    backend.put("a", "1")
+    backend.put("b", "2")
+    backend.put("c", "3")
+    assert backend.get("a") is None
+    assert (backend.get("b"), backend.get("c")) == ("2", "3")
+
+
+def test_disk_backend(tmp_path):
+    key = cache_key("arma", False, False, 75, "v")
+    DiskBackend(str(tmp_path)).put(key, "ar.ma")
+    # Another worker on the host sees the entry
+    backend = DiskBackend(str(tmp_path))
+    assert backend.get(key) == "ar.ma"
+    assert backend.get("0" * 64) is None
+    assert os.listdir(tmp_path / key[:2]) == [key]
+
+
+def test_disk_backend_prunes_least_recently_used(tmp_path):
+    backend = DiskBackend(str(tmp_path), max_bytes=10, prune_interval=3)
+    keys = [cache_key(text, False, False, 75, "v") for text in "abc"]
+    for i, key in enumerate(keys[:2]):
+        backend.put(key, "1234")
+        os.utime(backend._path(key), (i, i))
+    # Reading the oldest entry makes the other one the least recently used
+    assert backend.get(keys[0]) == "1234"
+    backend.put(keys[2], "1234")
+    assert [backend.get(key) for key in keys] == ["1234", None, "1234"]
+
+
+def test_hits_are_copied_into_faster_backends(tmp_path):
+    memory, disk = MemoryBackend(), DiskBackend(str(tmp_path))
+    disk.put("k", "v")
+    cache = ResponseCache([memory, disk])
+    assert cache.get("k") == "v"
+    assert memory.get("k") == "v"
+
+
+def test_concurrent_misses_compute_once():
+    cache = ResponseCache([MemoryBackend()])
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: cache.get_or_compute("k", compute), range(8)))
+    assert results == ["value"] * 8
+    assert calls == [1]
+
+
+def test_leader_checks_backends_again():
+    class StoredMeanwhile(MemoryBackend):
+        # Misses once, as if another leader stored the value right after the lookup
+        def get(self, key):
+            if not hasattr(self, "missed"):
+                self.missed = True
+                self.put(key, "stored")
+                return None
+            return super().get(key)
+
+    cache = ResponseCache([StoredMeanwhile()])
+    assert cache.get_or_compute("k", lambda: "computed") == "stored"
+
+
+def _compute_once(directory, log):
+    def compute():
+        with open(log, "a") as f:
+            f.write("computed\n")
+        time.sleep(0.2)
+        return "value"
+
+    cache = ResponseCache([MemoryBackend(), DiskBackend(directory)])
+    assert cache.get_or_compute(cache_key("arma", False, False, 75, "v"), compute)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_workers_sharing_a_disk_backend_compute_once(tmp_path):
+    context = multiprocessing.get_context("fork")
+    log = tmp_path / "log"
+    workers = [
+        context.Process(target=_compute_once, args=(str(tmp_path / "cache"), log))
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert [worker.exitcode for worker in workers] == [0] * 4
+    assert log.read_text() == "computed\n"
@@ -0,0 +1,83 @@
+import sqlite3
+from dataclasses import replace
+
+import pytest
+
+import loquax
+from loquax import Document
+from loquax.abstractions import MorphismStore, Pipeline
+from loquax.abstractions.sqlite_cache import SQLiteCache
+from loquax.abstractions.syllabification import (
+    DEFAULT_STAGES,
+    default_pipeline,
+    persistent_pipeline,
+)
+from loquax.languages import Latin
+from loquax.text_processing.parallel import analyze_corpus
+
+TEXT = "Arma virumque canō, Trōiae quī prīmus ab ōrīs"
+
+
+@pytest.fixture
+def lang():
+    return Latin
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "analyses.sqlite")
+
+
+def describe(analysis):
+    return (
+        analysis.token,
+        analysis.phonemes,
+        [(s, s.is_long, s.to_string(ipa=True)) for s in analysis.syllables],
+    )
+
+
+def test_fingerprint_follows_rules(lang):
+    assert lang.fingerprint == replace(lang).fingerprint
+    fewer_morphisms = MorphismStore(lang.syllable_morphisms.morphisms[:-1])
+    changed = replace(lang, syllable_morphisms=fewer_morphisms)
+    assert changed.fingerprint != lang.fingerprint
+    assert Pipeline(lang, DEFAULT_STAGES).fingerprint != lang.fingerprint
+
+
+def test_fingerprint_follows_release(lang, monkeypatch):
+    monkeypatch.setattr(loquax, "__version__", "0.0.0")
+    assert replace(lang).fingerprint != lang.fingerprint
+
+
+def test_analyses_persist_across_caches(lang, path):
+    pipeline = persistent_pipeline(lang, path)
+    expected = [describe(a) for a in default_pipeline(lang).analyze(TEXT)]
+    assert [describe(a) for a in pipeline.analyze(TEXT)] == expected
+    pipeline.cache.close()
+
+    with SQLiteCache(path, lang, pipeline.fingerprint) as cache:
+        assert len(cache) == len(expected)
+        assert describe(cache.get("canō")) == expected[2]
+        assert cache.get("fātō") is None
+
+
+def test_stale_entries_are_ignored_and_pruned(lang, path):
+    with SQLiteCache(path, lang, "old rules") as old:
+        old.put("arma", default_pipeline(lang).run("arma"))
+    with SQLiteCache(path, lang, "new rules") as new:
+        assert new.get("arma") is None
+        assert new.prune() == 1
+    count = sqlite3.connect(path).execute("SELECT COUNT(*) FROM analyses").fetchone()
+    assert count == (0,)
+
+
+def test_workers_share_the_database(lang, path):
+    corpus = [TEXT, "Ītaliam fātō profugus Lāvīniaque vēnit"] * 4
+    expected = [Document(text, lang).to_string(scansion=True) for text in corpus]
+    for _ in range(2):
+        results = analyze_corpus(
+            corpus, "lat", scansion=True, processes=2, cache_path=path
+        )
+        assert list(results) == expected
+    with SQLiteCache(path, lang, Pipeline(lang, DEFAULT_STAGES).fingerprint) as cache:
+        assert len(cache) == 13
@@ -0,0 +1,62 @@
+import pickle
+
+import pytest
+
+from loquax.abstractions.syllabification import default_pipeline
+from loquax.languages import Latin
+from loquax.text_processing.parallel import corpus_statistics
+from loquax.text_processing.statistics import CorpusStatistics, syllable_structure
+
+
+@pytest.fixture
+def lang():
+    return Latin
+
+
+@pytest.fixture
+def corpus():
+    return [
+        "Arma virumque canō, Trōiae quī prīmus ab ōrīs",
+        "Ītaliam, fātō profugus, Lāvīniaque vēnit",
+        "lītora, multum ille et terrīs iactātus et altō",
+    ]
+
+
+def test_counts(lang):
+    statistics = CorpusStatistics.from_text("arma virumque canō", lang)
+    assert statistics.tokens == 3
+    assert statistics.syllables == 7
+    assert statistics.long_syllables == 1
+    assert statistics.short_syllables == 6
+    assert statistics.long_ratio == pytest.approx(1 / 7)
+    assert statistics.phonemes["a"] == 3
+    assert statistics.phonemes["ō"] == 1
+    assert statistics.vowels == 7
+    assert statistics.consonants == sum(statistics.phonemes.values()) - 7
+    assert statistics.structures == {"VC": 1, "CV": 5, "CVC": 1}
+    assert list(statistics.structure_distribution()) == ["CV", "VC", "CVC"]
+    assert sum(statistics.phoneme_frequencies().values()) == pytest.approx(1.0)
+
+
+def test_syllable_structure(lang):
+    syllables = default_pipeline(lang).run("trāns").syllables
+    assert [syllable_structure(s) for s in syllables] == ["CCVCC"]
+
+
+def test_empty(lang):
+    statistics = CorpusStatistics.from_text("", lang)
+    assert statistics.tokens == 0
+    assert statistics.long_ratio == 0.0
+    assert statistics.structure_distribution() == {}
+
+
+def test_merge_matches_whole(lang, corpus):
+    whole = CorpusStatistics.from_text(" ".join(corpus), lang)
+    shards = [CorpusStatistics.from_text(text, lang) for text in corpus]
+    assert shards[0] + shards[1] + shards[2] == whole
+    assert pickle.loads(pickle.dumps(whole)) == whole
+
+
+def test_corpus_statistics_matches_serial(lang, corpus):
+    expected = CorpusStatistics.from_text(" ".join(corpus * 5), lang)
+    assert corpus_statistics(corpus * 5, "lat", processes=2, chunksize=2) == expected
@@ -0,0 +1,85 @@
+from dataclasses import replace
+
+import pytest
+
+from loquax.abstractions import Tokenizer, TokenSpan
+from loquax.languages import Latin
+from loquax.text_processing import EditableDocument
+
+TEXT = "Arma virumque canō, Trōiae quī prīmus ab ōrīs\n(1) Ītaliam, fā-tō profugus"
+
+
+@pytest.fixture
+def tokenizer():
+    return Latin.tokenizer
+
+
+def test_tokenize(tokenizer):
+    assert tokenizer.tokenize(TEXT) == [
+        "arma",
+        "virumque",
+        "canō",
+        "trōiae",
+        "quī",
+        "prīmus",
+        "ab",
+        "ōrīs",
+        "ītaliam",
+        "fātō",
+        "profugus",
+    ]
+
+
+def test_spans_point_into_source(tokenizer):
+    spans = list(tokenizer.tokenize_spans(TEXT))
+    assert [span.token for span in spans] == tokenizer.tokenize(TEXT)
+    assert [TEXT[span.start : span.end] for span in spans[2:4]] == ["canō", "Trōiae"]
+    assert TEXT[spans[9].start : spans[9].end] == "fā-tō"
+
+
+def test_spans_when_lowercasing_changes_length(tokenizer):
+    text = "İta, est"
+    assert list(tokenizer.tokenize_spans(text)) == [
+        TokenSpan("ita", 0, 3),
+        TokenSpan("est", 5, 8),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 50])
+def test_stream_spans_match_whole_text(tokenizer, size):
+    chunks = [TEXT[i : i + size] for i in range(0, len(TEXT), size)]
+    assert list(tokenizer.tokenize_stream_spans(chunks)) == list(
+        tokenizer.tokenize_spans(TEXT)
+    )
+    assert list(tokenizer.tokenize_stream(chunks)) == tokenizer.tokenize(TEXT)
+
+
+def test_decomposed_accents_are_composed(tokenizer):
+    text = "Arma\u0304 cano\u0304,  vi\u0304rum"
+    assert tokenizer.tokenize(text) == ["armā", "canō", "vīrum"]
+    spans = list(tokenizer.tokenize_spans(text))
+    assert [span.token for span in spans] == ["armā", "canō", "vīrum"]
+    assert [(span.start, span.end) for span in spans] == [(0, 5), (6, 11), (14, 20)]
+
+
+class WhitespaceTokenizer(Tokenizer):
+    def tokenize(self, text):
+        return text.lower().split()
+
+
+def test_default_spans_locate_tokens():
+    text = "Arma  virumque arma\ncanō"
+    assert list(WhitespaceTokenizer().tokenize_spans(text)) == [
+        TokenSpan("arma", 0, 4),
+        TokenSpan("virumque", 6, 14),
+        TokenSpan("arma", 15, 19),
+        TokenSpan("canō", 20, 24),
+    ]
+
+
+def test_default_spans_support_editable_documents():
+    lang = replace(Latin, tokenizer=WhitespaceTokenizer())
+    doc = EditableDocument("arma virumque", lang)
+    doc.edit(5, 13, "canō")
+    assert doc.text == "arma canō"
+    assert doc.to_string() == "ar.ma    ca.nō"
@@ -0,0 +1,72 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("flask")
+sys.path.insert(0, str(Path(__file__).parent.parent / "webapp"))
+
+from app import app  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def records(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_translate_and_etag(client):
+    response = client.post("/loquax", json={"text": "arma virumque"})
+    assert response.status_code == 200
+    assert response.get_json() == {"translation": "ar.ma    vi.rum.que"}
+    etag = response.headers["ETag"]
+    location = response.headers["Content-Location"]
+    assert location == "/loquax/translations/" + etag.strip('"')
+
+    # Conditional requests are only answered on the GET resource
+    response = client.post(
+        "/loquax", json={"text": "arma virumque"}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    response = client.get(location)
+    assert response.status_code == 200
+    assert response.get_json() == {"translation": "ar.ma    vi.rum.que"}
+    assert response.headers["ETag"] == etag
+    response = client.get(location, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize("key", ["0" * 64, "..", "0123"])
+def test_unknown_translation(client, key):
+    assert client.get(f"/loquax/translations/{key}").status_code == 404
+
+
+def test_batch(client):
+    response = client.post("/batch", json={"texts": ["arma", "canō"]})
+    assert response.mimetype == "application/x-ndjson"
+    assert records(response) == [
+        {"index": 0, "line": "ar.ma"},
+        {"index": 0, "done": True},
+        {"index": 1, "line": "ca.nō"},
+        {"index": 1, "done": True},
+    ]
+
+
+@pytest.mark.parametrize(
+    "body", ['{"texts": "ab"}', '{"texts": ["a", 1]}', '{"text": 1}', "null", "[1]"]
+)
+def test_batch_rejects_bad_input(client, body):
+    response = client.post("/batch", data=body, content_type="application/json")
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_batch_reports_unanalyzable_text(client):
+    response = client.post("/batch", json={"texts": ["wow", "arma"]})
+    lines = records(response)
+    assert lines[0]["index"] == 0 and "error" in lines[0]
+    assert lines[1:] == [{"index": 1, "line": "ar.ma"}, {"index": 1, "done": True}]
@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from loquax import Document
@@ -49,3 +50,42 @@ class TestDocument(unittest.TestCase):
             self.lang,
         )
         print(doc)
+
+
+class TestStreamingDocument(unittest.TestCase):
+    def setUp(self):
+        self.lang = Latin
+        self.text = (
+            "Arma virumque canō, Trōiae quī prīmus ab ōrīs\n"
+            "Ītaliam, fātō profugus, Lāvīniaque vēnit\n"
+            "lītora, multum ille et terrīs iactātus et altō\n"
+        )
+
+    def test_chunked_input_matches_string(self):
+        chunks = [self.text[i : i + 7] for i in range(0, len(self.text), 7)]
+        for scansion in (False, True):
+            expected = Document(self.text, self.lang, 40).to_string(
+                ipa=True, scansion=scansion
+            )
+            streamed = Document(iter(chunks), self.lang, 40).to_string(
+                ipa=True, scansion=scansion
+            )
+            self.assertEqual(streamed, expected)
+
+    def test_file_input(self):
+        with io.StringIO(self.text) as source:
+            tokens = [token.value for token in Document(source, self.lang).tokens]
+        self.assertEqual(tokens, self.lang.tokenizer.tokenize(self.text))
+
+    def test_lines_are_lazy(self):
+        def chunks():
+            while True:
+                yield "arma virumque canō "
+
+        lines = Document(chunks(), self.lang, 40).lines(scansion=True)
+        first = [next(lines) for _ in range(4)]
+        self.assertEqual(first[0], "ar.ma    vi.rum.que    ca.nō    ar.ma")
+
+    def test_book_length_document(self):
+        doc = Document("arma virumque canō " * 20000, self.lang, 75)
+        self.assertEqual(len(doc.to_string().split("\n")), 8572)
@@ -1,9 +1,32 @@
-from flask import Flask, request, jsonify, render_template
+import json
+
+from flask import (
+    Flask,
+    Response,
+    request,
+    jsonify,
+    render_template,
+    stream_with_context,
+)
 from loquax import Document
 from loquax.languages import Latin
+from response_cache import (
+    cache_key,
+    from_environment,
+    is_cache_key,
+    language_version,
+)
 
 app = Flask(__name__)
 
+LINE_WIDTH = 75
+# Translations are immutable under their content address
+TRANSLATION_MAX_AGE = 365 * 24 * 60 * 60
+
+LANGUAGE_VERSION = language_version(Latin)
+
+responses = from_environment()
+
 
 @app.route("/", methods=["GET", "POST"])
 @app.route("/loquax", methods=["GET", "POST"])
@@ -14,10 +37,78 @@ def index():
         with_scansion = data.get("with_scansion", False)
         with_ipa = data.get("with_ipa", False)
 
-        translation = Document(text, Latin, 75).to_string(
-            ipa=with_ipa, scansion=with_scansion
+        key = cache_key(text, with_ipa, with_scansion, LINE_WIDTH, LANGUAGE_VERSION)
+        translation = responses.get_or_compute(
+            key,
+            lambda: Document(text, Latin, LINE_WIDTH).to_string(
+                ipa=with_ipa, scansion=with_scansion
+            ),
         )
 
-        return jsonify({"translation": translation})
+        # POST responses are not conditional (a 304 is only meant for GET and HEAD), so
+        # the translation is also served from a GET resource that clients can revalidate
+        response = jsonify({"translation": translation})
+        response.set_etag(key)
+        prefix = "/loquax" if request.path.startswith("/loquax") else ""
+        response.headers["Content-Location"] = f"{prefix}/translations/{key}"
+        return response
 
     return render_template("index.html")
+
+
+@app.route("/translations/<key>")
+@app.route("/loquax/translations/<key>")
+def translation(key):
+    """
+    A translation computed earlier, by the cache key in the Content-Location of the
+    response to its POST, or 404 once it is no longer cached.
+    """
+    translation = responses.get(key) if is_cache_key(key) else None
+    if translation is None:
+        return jsonify({"error": "Unknown or expired translation."}), 404
+    if key in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = jsonify({"translation": translation})
+    response.set_etag(key)
+    response.cache_control.public = True
+    response.cache_control.max_age = TRANSLATION_MAX_AGE
+    return response
+
+
+@app.route("/batch", methods=["POST"])
+@app.route("/loquax/batch", methods=["POST"])
+def batch():
+    """
+    Analyze many texts ({"texts": [...]}) or a single large one ({"text": ...}) and stream
+    the rendered lines back as NDJSON while they are produced. Every line is sent as
+    {"index": <text index>, "line": ...}, and each text ends with {"index": ..., "done": true},
+    or with {"index": ..., "error": ...} if it cannot be analyzed.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Expected a JSON object."}), 400
+    texts = data["texts"] if "texts" in data else [data.get("text")]
+    if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+        return jsonify({"error": "Expected 'texts' to be a list of strings."}), 400
+    with_scansion = data.get("with_scansion", False)
+    with_ipa = data.get("with_ipa", False)
+
+    def generate():
+        for i, text in enumerate(texts):
+            lines = Document(text, Latin, LINE_WIDTH).lines(
+                ipa=with_ipa, scansion=with_scansion
+            )
+            try:
+                for line in lines:
+                    record = {"index": i, "line": line}
+                    yield json.dumps(record, ensure_ascii=False) + "\n"
+            except ValueError as e:
+                # Text the language cannot analyze: the headers are already sent, so
+                # the error is reported in the stream and the other texts still follow
+                record = {"index": i, "error": str(e)}
+                yield json.dumps(record, ensure_ascii=False) + "\n"
+                continue
+            yield json.dumps({"index": i, "done": True}) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
@@ -0,0 +1,365 @@
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from loquax.languages import Latin, get_language
+from loquax.text_processing.parallel import render_lines, render_text
+from response_cache import (
+    cache_key,
+    from_environment,
+    is_cache_key,
+    language_version,
+)
+
+# An asyncio variant of app.py, for any ASGI server:
+#
+#     uvicorn asgi:app
+#
+# Documents are analyzed in a pool of worker processes, so the event loop only parses
+# requests and answers cache hits. At most LOQUAX_QUEUE_LIMIT renders wait for a free
+# worker; requests beyond that are refused at once with a 503 instead of queueing up
+# behind long texts.
+
+LINE_WIDTH = 75
+LANGUAGE_VERSION = language_version(Latin)
+MAX_BODY_SIZE = int(os.environ.get("LOQUAX_MAX_BODY_SIZE", str(1 << 20)))
+RETRY_AFTER_SECONDS = 1
+# Translations are immutable under their content address
+TRANSLATION_MAX_AGE = 365 * 24 * 60 * 60
+
+_INDEX = (Path(__file__).parent / "templates" / "index.html").read_bytes()
+
+Send = Callable[[dict], Awaitable[None]]
+Receive = Callable[[], Awaitable[dict]]
+
+
+class RenderPool:
+    """
+    A pool of `workers` processes rendering documents, and a count of the renders
+    submitted to it but not finished. The pool is saturated once `queue_limit` renders
+    are waiting on top of one per worker; callers should then turn requests away.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.capacity = workers + queue_limit
+        self.pending = 0
+        # Workers are spawned rather than forked from the serving process and its threads,
+        # and load the language once as they start
+        self.executor = ProcessPoolExecutor(
+            workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=get_language,
+            initargs=(Latin.iso_639_code,),
+        )
+
+    @property
+    def saturated(self) -> bool:
+        return self.pending >= self.capacity
+
+    def render(self, text: str, ipa: bool, scansion: bool) -> "asyncio.Future[str]":
+        """
+        Start rendering a text in a worker. The render counts as pending until it is
+        done, even if whoever awaited it gave up, since it keeps a worker busy until then.
+        """
+        return self._submit(render_text, text, ipa, scansion)
+
+    def render_lines(
+        self, text: str, ipa: bool, scansion: bool
+    ) -> "asyncio.Future[List[str]]":
+        """
+        Like `render`, for the rendered lines of the text.
+        """
+        return self._submit(render_lines, text, ipa, scansion)
+
+    def _submit(
+        self, fn: Callable[..., object], text: str, ipa: bool, scansion: bool
+    ) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = self.executor.submit(
+            fn, Latin.iso_639_code, LINE_WIDTH, ipa, scansion, text
+        )
+        self.pending += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        return asyncio.wrap_future(future, loop=loop)
+
+    def _release(self):
+        self.pending -= 1
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def from_environment_pool() -> RenderPool:
+    """
+    A pool of LOQUAX_WORKERS processes (default: the CPU count) admitting
+    LOQUAX_QUEUE_LIMIT waiting renders (default: twice the number of workers).
+    """
+    workers = int(os.environ.get("LOQUAX_WORKERS", "0")) or os.cpu_count() or 1
+    queue_limit = int(os.environ.get("LOQUAX_QUEUE_LIMIT", str(2 * workers)))
+    return RenderPool(workers, queue_limit)
+
+
+responses = from_environment()
+_pool: Optional[RenderPool] = None
+# Renders in progress by cache key, so concurrent identical requests share one render
+_in_flight: Dict[str, "asyncio.Future[str]"] = {}
+
+
+def _get_pool() -> RenderPool:
+    global _pool
+    if _pool is None:
+        _pool = from_environment_pool()
+    return _pool
+
+
+class _RequestError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+async def _read_json(receive: Receive) -> dict:
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise _RequestError(400, "The client disconnected.")
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_SIZE:
+            raise _RequestError(413, "The request body is too large.")
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    try:
+        data = json.loads(b"".join(chunks))
+    except ValueError:
+        raise _RequestError(400, "Expected a JSON body.") from None
+    if not isinstance(data, dict):
+        raise _RequestError(400, "Expected a JSON object.")
+    return data
+
+
+async def _respond(
+    send: Send,
+    status: int,
+    body: bytes = b"",
+    content_type: str = "application/json",
+    headers: Iterable[Tuple[str, str]] = (),
+):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", content_type.encode("latin-1")),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ]
+            + [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _respond_json(send: Send, status: int, data: dict, headers=()):
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    await _respond(send, status, body, headers=headers)
+
+
+async def _respond_busy(send: Send):
+    await _respond_json(
+        send,
+        503,
+        {"error": "The server is busy, please try again shortly."},
+        [("retry-after", str(RETRY_AFTER_SECONDS))],
+    )
+
+
+def _if_none_match(scope: dict) -> List[str]:
+    for name, value in scope["headers"]:
+        if name == b"if-none-match":
+            return [
+                tag.strip().removeprefix("W/").strip('"')
+                for tag in value.decode("latin-1").split(",")
+            ]
+    return []
+
+
+def _options(data: dict) -> Tuple[bool, bool]:
+    return bool(data.get("with_ipa", False)), bool(data.get("with_scansion", False))
+
+
+async def _translate(scope: dict, receive: Receive, send: Send):
+    data = await _read_json(receive)
+    text = data.get("text")
+    if not isinstance(text, str):
+        raise _RequestError(400, "Expected 'text' to be a string.")
+    with_ipa, with_scansion = _options(data)
+
+    key = cache_key(text, with_ipa, with_scansion, LINE_WIDTH, LANGUAGE_VERSION)
+    # POST responses are not conditional (a 304 is only meant for GET and HEAD), so the
+    # translation is also served from a GET resource that clients can revalidate
+    prefix = "/loquax" if scope["path"].startswith("/loquax") else ""
+    headers = [
+        ("etag", f'"{key}"'),
+        ("content-location", f"{prefix}/translations/{key}"),
+    ]
+
+    # The disk backend does file I/O, which is kept off the event loop
+    translation = await asyncio.to_thread(responses.get, key)
+    if translation is None:
+        render = _in_flight.get(key)
+        if render is None:
+            pool = _get_pool()
+            if pool.saturated:
+                await _respond_busy(send)
+                return
+            render = _in_flight[key] = pool.render(text, with_ipa, with_scansion)
+            render.add_done_callback(lambda done: _finish(key, done))
+        # Shielded, so a client going away does not cancel the render for the others
+        try:
+            translation = await asyncio.shield(render)
+        except ValueError as e:
+            # Text the language cannot analyze
+            raise _RequestError(400, str(e)) from None
+
+    await _respond_json(send, 200, {"translation": translation}, headers)
+
+
+async def _translation(scope: dict, receive: Receive, send: Send):
+    """
+    A translation computed earlier, by the cache key in the Content-Location of the
+    response to its POST, or 404 once it is no longer cached.
+    """
+    key = scope["path"].rsplit("/", 1)[1]
+    translation = None
+    if is_cache_key(key):
+        translation = await asyncio.to_thread(responses.get, key)
+    if translation is None:
+        raise _RequestError(404, "Unknown or expired translation.")
+
+    headers = [
+        ("etag", f'"{key}"'),
+        ("cache-control", f"public, max-age={TRANSLATION_MAX_AGE}"),
+    ]
+    matches = _if_none_match(scope)
+    if key in matches or "*" in matches:
+        await _respond(send, 304, headers=headers)
+    else:
+        await _respond_json(send, 200, {"translation": translation}, headers)
+
+
+def _finish(key: str, render: "asyncio.Future[str]"):
+    del _in_flight[key]
+    if not render.cancelled() and render.exception() is None:
+        asyncio.get_running_loop().run_in_executor(
+            None, responses.put, key, render.result()
+        )
+
+
+async def _batch(scope: dict, receive: Receive, send: Send):
+    """
+    Analyze many texts ({"texts": [...]}) or a single large one ({"text": ...}) and send
+    the rendered lines back as NDJSON as each text is done, in the records of app.py's
+    /batch. A batch is admitted as a whole, then renders its texts one at a time.
+    """
+    data = await _read_json(receive)
+    texts = data["texts"] if "texts" in data else [data.get("text")]
+    if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+        raise _RequestError(400, "Expected 'texts' to be a list of strings.")
+    with_ipa, with_scansion = _options(data)
+
+    pool = _get_pool()
+    if pool.saturated:
+        await _respond_busy(send)
+        return
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/x-ndjson")],
+        }
+    )
+    for i, text in enumerate(texts):
+        try:
+            lines = await pool.render_lines(text, with_ipa, with_scansion)
+        except ValueError as e:
+            # Text the language cannot analyze: the headers are already sent, so the
+            # error is reported in the stream and the other texts still follow
+            records = [{"index": i, "error": str(e)}]
+        else:
+            records = [{"index": i, "line": line} for line in lines]
+            records.append({"index": i, "done": True})
+        body = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        await send(
+            {
+                "type": "http.response.body",
+                "body": body.encode("utf-8"),
+                "more_body": True,
+            }
+        )
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _health(scope: dict, receive: Receive, send: Send):
+    pool = _get_pool()
+    await _respond_json(
+        send,
+        200,
+        {"pending": pool.pending, "capacity": pool.capacity, "busy": pool.saturated},
+    )
+
+
+async def _lifespan(receive: Receive, send: Send):
+    global _pool
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            _get_pool()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            if _pool is not None:
+                _pool.shutdown()
+                _pool = None
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+_ROUTES = {
+    ("POST", "/"): _translate,
+    ("POST", "/loquax"): _translate,
+    ("POST", "/loquax/"): _translate,
+    ("POST", "/batch"): _batch,
+    ("POST", "/loquax/batch"): _batch,
+    ("GET", "/health"): _health,
+    ("GET", "/loquax/health"): _health,
+}
+
+
+async def app(scope: dict, receive: Receive, send: Send):
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    method, path = scope["method"], scope["path"]
+    if method == "GET" and path in ("/", "/loquax", "/loquax/"):
+        await _respond(send, 200, _INDEX, "text/html; charset=utf-8")
+        return
+    handler = _ROUTES.get((method, path))
+    if method == "GET" and path.startswith(("/translations/", "/loquax/translations/")):
+        handler = _translation
+    if handler is None:
+        await _respond_json(send, 404, {"error": "Not found."})
+        return
+    try:
+        await handler(scope, receive, send)
+    except _RequestError as e:
+        await _respond_json(send, e.status, {"error": str(e)})
@@ -0,0 +1,259 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from contextlib import ExitStack, contextmanager, nullcontext
+from importlib.metadata import PackageNotFoundError, version
+from threading import Lock
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows, where gunicorn does not run anyway
+    fcntl = None
+
+from loquax.abstractions import Language, LRUCache
+
+
+def language_version(language: Language) -> str:
+    """
+    Part of every response cache key: a new release or any change to the rules of the
+    language invalidates the cached responses.
+    """
+    try:
+        release = version("loquax")
+    except PackageNotFoundError:
+        release = "dev"
+    return f"{language.iso_639_code}:{release}:{language.fingerprint}"
+
+
+def cache_key(
+    text: str, ipa: bool, scansion: bool, line_width: int, language_version: str
+) -> str:
+    """
+    Content address of a rendering: the SHA-256 of everything that determines its output.
+    """
+    payload = json.dumps(
+        [text, ipa, scansion, line_width, language_version], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cache_key(key: str) -> bool:
+    """
+    Whether `key` is shaped like a `cache_key`, e.g. before looking up a key taken from
+    a URL.
+    """
+    return re.fullmatch("[0-9a-f]{64}", key) is not None
+
+
+class Backend(ABC):
+    """
+    A store of rendered responses keyed by their content address.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, value: str) -> None:
+        pass
+
+    def lock(self, key: str) -> ContextManager:
+        """
+        Held while a response missing from the backend is computed, so the other
+        processes sharing the backend wait for it instead of computing it as well.
+        Backends private to a process need no lock.
+        """
+        return nullcontext()
+
+
+class MemoryBackend(Backend):
+    """
+    An in-process LRU store, private to each worker.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.entries: LRUCache[str, str] = LRUCache(maxsize)
+
+    def get(self, key: str) -> Optional[str]:
+        return self.entries.get(key)
+
+    def put(self, key: str, value: str) -> None:
+        self.entries.put(key, value)
+
+
+class DiskBackend(Backend):
+    """
+    A store of one file per key under `directory`, shared by every worker on the host.
+    Files are written to a temporary name and renamed into place, so readers never see
+    a partial response. Every `prune_interval` writes, the least recently used files
+    are deleted until the store is back under `max_bytes`, so it may briefly exceed it.
+    Computations are locked across processes with one of 256 lock files, chosen by key.
+    """
+
+    def __init__(
+        self, directory: str, max_bytes: int = 1 << 30, prune_interval: int = 128
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.prune_interval = prune_interval
+        self._writes = 0
+        os.makedirs(os.path.join(directory, "locks"), exist_ok=True)
+        self.prune()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                value = f.read()
+        except FileNotFoundError:
+            return None
+        # The modification time is the last use, for pruning
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._writes += 1
+        if self._writes % self.prune_interval == 0:
+            self.prune()
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        path = os.path.join(self.directory, "locks", key[:2] + ".lock")
+        with open(path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def prune(self) -> int:
+        """
+        Delete the least recently used responses until the store holds at most
+        `max_bytes`, returning how many were deleted.
+        """
+        entries = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir() or shard.name == "locks":
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        deleted = 0
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                deleted += 1
+            except FileNotFoundError:
+                # Pruned by another worker meanwhile
+                pass
+            size -= entry_size
+        return deleted
+
+
+class ResponseCache:
+    """
+    Looks responses up in each backend in turn (copying hits into the faster ones), and
+    computes misses once: concurrent requests for a key that is being computed wait for
+    that computation instead of starting their own. Threads of one process wait on each
+    other directly; other processes wait on the locks of the shared backends, if any (a
+    DiskBackend), and then read the response from there.
+    """
+
+    def __init__(self, backends: List[Backend]):
+        self.backends = backends
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        for i, backend in enumerate(self.backends):
+            value = backend.get(key)
+            if value is not None:
+                for faster in self.backends[:i]:
+                    faster.put(key, value)
+                return value
+        return None
+
+    def put(self, key: str, value: str) -> None:
+        for backend in self.backends:
+            backend.put(key, value)
+
+    def get_or_compute(self, key: str, compute: Callable[[], str]) -> str:
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = Future()
+        if not leader:
+            return call.result()
+
+        try:
+            with ExitStack() as locks:
+                for backend in self.backends:
+                    locks.enter_context(backend.lock(key))
+                # A previous leader, here or in another process, may have stored the
+                # value since the lookup above
+                value = self.get(key)
+                if value is None:
+                    value = compute()
+                    self.put(key, value)
+            call.set_result(value)
+            return value
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+def from_environment() -> ResponseCache:
+    """
+    An in-process LRU of LOQUAX_CACHE_SIZE entries (default 1024), backed by a disk store
+    of LOQUAX_CACHE_DIR_MB megabytes (default 1024) in LOQUAX_CACHE_DIR when that
+    variable is set.
+    """
+    backends: List[Backend] = [
+        MemoryBackend(int(os.environ.get("LOQUAX_CACHE_SIZE", "1024")))
+    ]
+    if os.environ.get("LOQUAX_CACHE_DIR"):
+        max_bytes = int(os.environ.get("LOQUAX_CACHE_DIR_MB", "1024")) << 20
+        backends.append(DiskBackend(os.environ["LOQUAX_CACHE_DIR"], max_bytes))
+    return ResponseCache(backends)